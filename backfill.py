@@ -0,0 +1,175 @@
+"""Historical backfill of raw_stock_data from Sharesansar day pages.
+
+Fetches a date range through a bounded worker pool, paced by a token-bucket
+rate limiter, and skips dates already stored. Sector counts, SMAs and
+constituents are recounted once for the whole range at the end. Point it
+at recorded pages served locally to test without touching the live site:
+
+    python -m http.server 8000 --directory fixtures
+    python backfill.py 2024-03-10 2024-03-14 --url "http://127.0.0.1:8000/{date}.html"
+
+fixtures/ holds pages for 2024-03-12 to 2024-03-14; the other dates get a
+404 and are skipped like non-trading days.
+"""
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app import REQUEST_HEADERS, StockDataManager
+
+# Day page for a past trading date; {date} is YYYY-MM-DD
+HISTORY_URL = "https://www.sharesansar.com/today-share-price?date={date}"
+
+# NEPSE trades Sunday to Thursday
+NON_TRADING_WEEKDAYS = {4, 5}  # Friday, Saturday
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class Backfiller:
+    """Fetch and store historical day pages that are missing from raw_stock_data."""
+
+    def __init__(self, manager=None, url_template=HISTORY_URL, workers=4, rate=2.0,
+                 burst=2, retries=3, backoff=1.0, timeout=10):
+        self.manager = manager or StockDataManager()
+        self.url_template = url_template
+        self.workers = workers
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        # One keep-alive session sized to the worker pool
+        self.session = requests.Session()
+        self.session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def pending_dates(self, start, end):
+        """Trading weekdays in [start, end] that are not stored yet, oldest first."""
+        stored = set(self.manager.get_available_dates('raw'))
+        day, pending = start, []
+        while day <= end:
+            if day.weekday() not in NON_TRADING_WEEKDAYS and day.strftime("%Y-%m-%d") not in stored:
+                pending.append(day)
+            day += timedelta(days=1)
+        return pending
+
+    def fetch_day(self, day):
+        """Fetch and parse one day page, retrying transient failures.
+
+        Connection errors, timeouts and 5xx responses are retried. Returns
+        the parsed table, or None when there is no page for the date (a 4xx
+        response) or the page is for another date (holidays return the
+        latest trading day instead).
+        """
+        url = self.url_template.format(date=day.strftime("%Y-%m-%d"))
+        for attempt in range(self.retries + 1):
+            try:
+                self.bucket.acquire()
+                response = self.session.get(url, timeout=self.timeout)
+                if 400 <= response.status_code < 500:
+                    logging.info(f"Backfill {day}: HTTP {response.status_code}, skipping")
+                    return None
+                response.raise_for_status()
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                if attempt == self.retries:
+                    raise
+                logging.warning(f"Backfill {day}: attempt {attempt + 1} failed ({e}), retrying")
+                time.sleep(self.backoff * 2 ** attempt)
+
+        df, page_date = self.manager.parse_stock_page(response.text)
+        if df is None:
+            raise ValueError(f"No trading table in page for {day}")
+        if page_date != day:
+            return None
+        return df
+
+    def run(self, start, end, progress=None):
+        """Backfill [start, end]; returns dates saved, skipped and failed.
+
+        ``progress`` is called as ``progress(done, total)`` after each date.
+        """
+        pending = self.pending_dates(start, end)
+        summary = {"saved": [], "skipped": [], "failed": []}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backfill") as pool:
+            futures = {pool.submit(self.fetch_day, day): day for day in pending}
+            for done, future in enumerate(as_completed(futures), start=1):
+                day = futures[future]
+                try:
+                    df = future.result()
+                    if df is None:
+                        summary["skipped"].append(day)
+                    elif self.manager.save_stock_data(df, 'raw', day, update_breadth=False):
+                        summary["saved"].append(day)
+                    else:
+                        summary["failed"].append(day)
+                except Exception as e:
+                    logging.error(f"Backfill {day} failed: {e}")
+                    summary["failed"].append(day)
+                if progress:
+                    progress(done, len(pending))
+
+        for key in summary:
+            summary[key].sort()
+
+        # Days arrive out of order, and each older day would force a full SMA
+        # and registry rebuild; recount the backfilled range once instead
+        if summary["saved"]:
+            self.manager.update_sector_breadth(summary["saved"][0], summary["saved"][-1])
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill raw_stock_data for a date range.")
+    parser.add_argument("start", help="first date, YYYY-MM-DD")
+    parser.add_argument("end", help="last date, YYYY-MM-DD")
+    parser.add_argument("--url", default=HISTORY_URL, help="day page URL template with {date}")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=2.0, help="requests per second")
+    parser.add_argument("--retries", type=int, default=3)
+    args = parser.parse_args()
+
+    backfiller = Backfiller(url_template=args.url, workers=args.workers, rate=args.rate, retries=args.retries)
+    summary = backfiller.run(
+        datetime.strptime(args.start, "%Y-%m-%d").date(),
+        datetime.strptime(args.end, "%Y-%m-%d").date(),
+        progress=lambda done, total: print(f"\r{done}/{total}", end="", flush=True),
+    )
+    print()
+    for key, days in summary.items():
+        print(f"{key}: {len(days)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Backtest of the Performance_Score selection rule on stored daily quotes.
+
+Buys the top-N stocks by score at day t's LTP and measures the return to
+the LTP k stored trading days later. Forward returns come from one
+date x symbol LTP matrix, so each parameter set only re-scores and looks
+up returns. Parameter sweeps run across a process pool:
+
+    python backtest.py 2024-01-01 2024-06-30 --thresholds 2 3 4 --weights 0.4 0.6 0.8
+"""
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import pandas as pd
+
+from scoring import CHANGE_WEIGHT, score_panel
+
+DEFAULT_HORIZONS = (1, 5)
+
+# Each parameter set takes tens of milliseconds on a year of quotes, while a
+# spawned worker needs about a second to start, so small grids run in process
+POOL_MIN_GRID = 50
+
+RESULT_COLUMNS = [
+    "change_threshold", "change_weight", "volume_weight", "horizon",
+    "trades", "hit_rate", "avg_return", "market_return",
+]
+
+# Set in each worker process by _init_worker
+_worker_quotes = None
+_worker_returns = None
+
+
+def forward_returns(quotes, horizons=DEFAULT_HORIZONS):
+    """Forward LTP returns per horizon, as (date, symbol)-indexed Series in %."""
+    ltp = quotes.pivot_table(index="date", columns="symbol", values="ltp", aggfunc="last").sort_index()
+    ltp = ltp.where(ltp > 0)  # a zero LTP is a missing quote, not a price
+    return {
+        k: (ltp.shift(-k) / ltp - 1).mul(100).stack().rename("return")
+        for k in horizons
+    }
+
+
+def evaluate(scores, returns, top_n=10):
+    """Hit rate and average forward return of the daily top ``top_n`` picks."""
+    picks = scores.loc[scores["rank"] <= top_n, ["date", "symbol"]]
+    picks = pd.MultiIndex.from_frame(picks)
+    rows = []
+    for k, forward in returns.items():
+        realized = forward.reindex(picks).dropna()
+        pick_days = realized.index.get_level_values("date").unique()
+        market = forward[forward.index.get_level_values("date").isin(pick_days)]
+        rows.append({
+            "horizon": k,
+            "trades": len(realized),
+            "hit_rate": (realized > 0).mean() * 100 if len(realized) else float("nan"),
+            "avg_return": realized.mean(),
+            # Equal-weight return of every stock on the same days, for reference
+            "market_return": market.groupby(level="date").mean().mean(),
+        })
+    return rows
+
+
+def backtest(quotes, change_threshold=4, change_weight=CHANGE_WEIGHT, top_n=10,
+             horizons=DEFAULT_HORIZONS, returns=None):
+    """Backtest one parameter set; returns one row per horizon."""
+    returns = returns if returns is not None else forward_returns(quotes, horizons)
+    scores = score_panel(quotes, change_threshold, change_weight, 1 - change_weight)
+    rows = evaluate(scores, returns, top_n)
+    for row in rows:
+        row.update(change_threshold=change_threshold, change_weight=change_weight,
+                   volume_weight=round(1 - change_weight, 6))
+    return rows
+
+
+def sweep(quotes, thresholds, change_weights, top_n=10, horizons=DEFAULT_HORIZONS, workers=None):
+    """Backtest every (threshold, change weight) pair; volume weight is 1 - change weight.
+
+    ``workers=1`` runs in process; otherwise the grid is spread over a
+    process pool that receives the quotes once per worker. By default the
+    pool is only used for grids of at least ``POOL_MIN_GRID`` sets.
+    """
+    grid = list(product(thresholds, change_weights))
+    if workers is None:
+        workers = min(len(grid), os.cpu_count() or 1) if len(grid) >= POOL_MIN_GRID else 1
+    if workers <= 1:
+        returns = forward_returns(quotes, horizons)
+        rows = [row for threshold, weight in grid
+                for row in backtest(quotes, threshold, weight, top_n, horizons, returns)]
+    else:
+        # spawn: the app process runs threads, which fork does not copy safely
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(quotes, horizons),
+        ) as pool:
+            results = pool.map(_run_one, [(threshold, weight, top_n) for threshold, weight in grid])
+            rows = [row for result in results for row in result]
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)\
+        .sort_values(["horizon", "avg_return"], ascending=[True, False])\
+        .reset_index(drop=True)
+
+
+def _init_worker(quotes, horizons):
+    global _worker_quotes, _worker_returns
+    _worker_quotes = quotes
+    _worker_returns = forward_returns(quotes, horizons)
+
+
+def _run_one(params):
+    threshold, weight, top_n = params
+    return backtest(_worker_quotes, threshold, weight, top_n, returns=_worker_returns)
+
+
+def main():
+    from app import SupabaseManager  # Import here so workers don't load the app
+
+    parser = argparse.ArgumentParser(description="Backtest the Performance_Score rule on stored quotes.")
+    parser.add_argument("start", nargs="?", help="first date, YYYY-MM-DD")
+    parser.add_argument("end", nargs="?", help="last date, YYYY-MM-DD")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[2.5, 4.0])
+    parser.add_argument("--weights", type=float, nargs="+", default=[CHANGE_WEIGHT], help="change weights")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(DEFAULT_HORIZONS))
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    quotes = SupabaseManager().load_quotes(columns=["ltp", "pct_change", "volume"], start=args.start, end=args.end)
+    results = sweep(quotes, args.thresholds, args.weights, args.top, args.horizons, args.workers)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
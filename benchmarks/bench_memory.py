@@ -0,0 +1,72 @@
+"""Measure what sharing read-only datasets across sessions saves.
+
+Seeds a temporary embedded store with several years of sector data, then
+traces the memory held by N sessions' worth of the POS page's sector frames
+two ways: each session loading its own copy (what the page kept in session
+state before) and every session reading the one shared dataset. Memory is
+measured with tracemalloc, which also sees pandas/numpy buffers.
+
+    python benchmarks/bench_memory.py [sessions] [years]
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def held_bytes(load, sessions):
+    """Bytes still allocated while ``sessions`` results of ``load()`` are held."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [load() for _ in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    del held
+    gc.collect()
+    return after - before
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    os.environ["NEPSE_STORAGE"] = "sqlite"
+    os.environ["NEPSE_SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+    from constants import SECTORS
+    from pos import get_sector_frames, load_all_sector_data
+    from shared_data import drop_dataset
+    from storage import get_store
+
+    dates = pd.bdate_range(end=pd.Timestamp.today(), periods=years * 250).strftime("%Y-%m-%d")
+    get_store().table("sector_data").insert([
+        {
+            "sector": sector, "date": day, "positive_stock": 5, "negative_stock": 3,
+            "no_change": 1, "total_stock": 9, "positive_percentage": 55.5, "label": "mid",
+        }
+        for sector in SECTORS for day in dates
+    ]).execute()
+
+    tracemalloc.start()
+    # Warm the sync cache first so its own copy is not counted either way
+    load_all_sector_data()
+
+    copies = held_bytes(load_all_sector_data, sessions)
+    drop_dataset("pos.sector_data")
+    shared = held_bytes(get_sector_frames, sessions)
+    tracemalloc.stop()
+
+    mb = 2 ** 20
+    print(f"{len(dates) * len(SECTORS)} sector rows, {sessions} sessions")
+    print(f"per-session copies: {copies / mb:8.2f} MB")
+    print(f"shared dataset:     {shared / mb:8.2f} MB")
+    print(f"saved:              {(copies - shared) / mb:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
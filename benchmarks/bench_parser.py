@@ -0,0 +1,50 @@
+"""Compare the HTML parser backends on the stored sample pages.
+
+Checks that every backend returns exactly the same (date, headers, rows) as
+the BeautifulSoup reference, or raises the same error on a malformed page,
+then reports the mean parse time per page.
+
+    python benchmarks/bench_parser.py [repeat]
+"""
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from html_parsers import PARSERS  # noqa: E402
+
+
+def outcome(parser, page):
+    """The parse result, or the error type name for a page that raises."""
+    try:
+        return parser.parse(page)
+    except ValueError as e:
+        return type(e).__name__
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = sorted(glob.glob(os.path.join(ROOT, "fixtures", "*.html")))
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            page = f.read()
+
+        reference = outcome(PARSERS["bs4"](), page)
+        rows = f"{len(reference[2] or [])} rows" if isinstance(reference, tuple) else reference
+        print(f"{os.path.basename(path)}: {rows}, {len(page) / 1024:.0f} KiB")
+        for name, parser_cls in PARSERS.items():
+            parser = parser_cls()
+            if outcome(parser, page) != reference:
+                raise SystemExit(f"{name} output differs from bs4 on {path}")
+            start = time.perf_counter()
+            for _ in range(repeat):
+                outcome(parser, page)
+            elapsed = (time.perf_counter() - start) / repeat * 1000
+            print(f"  {name:<6} {elapsed:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Track time to first paint of the navigation shell.
+
+Each sample is a fresh interpreter (a cold start), running navigation.py
+once through Streamlit's AppTest harness against an embedded store so no
+network is needed. Reports the median script time and which page modules
+were imported along the way.
+
+    python benchmarks/bench_startup.py [samples] [page]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_MODULES = ["pos", "main2", "main", "app", "sma"]
+
+SAMPLE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+page = int(sys.argv[1])
+at = AppTest.from_file("navigation.py", default_timeout=120)
+at.session_state["current_page"] = page
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "errors": [str(e.value) for e in at.exception],
+    "imported": [m for m in %r if m in sys.modules],
+}))
+""" % PAGE_MODULES
+
+
+def sample(page, db_path):
+    env = dict(os.environ, NEPSE_STORAGE="sqlite", NEPSE_SQLITE_PATH=db_path)
+    result = subprocess.run(
+        [sys.executable, "-c", SAMPLE, str(page)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    page = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [sample(page, os.path.join(tmp, "bench.db")) for _ in range(samples)]
+
+    times = [run["seconds"] * 1000 for run in runs]
+    print(f"page {page}: first paint median {statistics.median(times):.1f} ms "
+          f"(min {min(times):.1f}, max {max(times):.1f}, n={samples})")
+    print(f"page modules imported: {', '.join(runs[-1]['imported']) or 'none'}")
+    if runs[-1]["errors"]:
+        print(f"script errors: {runs[-1]['errors']}")
+
+
+if __name__ == "__main__":
+    main()
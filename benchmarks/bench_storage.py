@@ -0,0 +1,64 @@
+"""Time common page reads against the embedded SQLite store.
+
+Seeds a temporary database with several years of daily rows for every
+sector and reports the average latency of the reads the pages issue.
+
+    python benchmarks/bench_storage.py [years]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import SQLiteStore, TABLE_SCHEMAS  # noqa: E402
+
+SECTORS = [
+    "Hydropower", "C. Bank", "D. Bank", "Finance", "Hotels",
+    "Microfinance", "Investments", "Life insurance", "Non-life insurance",
+    "Others", "Manufacture", "Tradings"
+]
+
+
+def seed(store, years):
+    dates = pd.bdate_range(end=pd.Timestamp.today(), periods=years * 250).strftime("%Y-%m-%d")
+    store.table("sector_data").insert([
+        {
+            "sector": sector, "date": day, "positive_stock": 5, "negative_stock": 3,
+            "no_change": 1, "total_stock": 9, "positive_percentage": 55.5, "label": "mid",
+        }
+        for sector in SECTORS for day in dates
+    ]).execute()
+    return dates
+
+
+def timed(label, query, repeat=50):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = query().data
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"{label:<40} {elapsed:8.3f} ms  ({len(rows)} rows)")
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(os.path.join(tmp, "bench.db"))
+        dates = seed(store, years)
+        columns = ",".join(TABLE_SCHEMAS["sector_data"]["columns"])
+        print(f"sector_data: {len(SECTORS)} sectors x {len(dates)} days")
+        timed("one (sector, date) row", lambda: store.table("sector_data").select("*")
+              .eq("sector", "Hotels").eq("date", dates[-1]).execute())
+        timed("one date, all sectors", lambda: store.table("sector_data").select("*")
+              .eq("date", dates[-1]).execute())
+        timed("one sector, full history", lambda: store.table("sector_data").select("*")
+              .eq("sector", "Hotels").execute())
+        timed("all sectors, full history", lambda: store.table("sector_data").select(columns)
+              .execute(), repeat=5)
+
+
+if __name__ == "__main__":
+    main()
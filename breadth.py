@@ -0,0 +1,63 @@
+"""Market breadth: how many stocks moved at least a given % in a day.
+
+Every threshold is answered from one sorted array of % changes with
+``searchsorted``, so adding thresholds costs a binary search each rather
+than another pass over the table. The universe is the number of stocks
+with a % change that day, not a fixed count.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLDS = [4.0, 2.5]
+
+BREADTH_COLUMNS = ["date", "threshold", "up", "up_pct", "down", "down_pct", "total"]
+
+
+def daily_breadth(quotes, thresholds=DEFAULT_THRESHOLDS, date_col="date", change_col="pct_change"):
+    """Breadth for every day in a long-form (date, % change) frame.
+
+    Returns one row per (date, threshold) with the number and percentage of
+    stocks up at least ``threshold`` and down at least ``threshold``.
+    """
+    thresholds = np.asarray(sorted(set(float(t) for t in thresholds)), dtype=float)
+    values = pd.to_numeric(quotes[change_col], errors="coerce")
+    valid = values.notna().to_numpy()
+    codes, dates = pd.factorize(quotes[date_col][valid], sort=True)
+    values = values.to_numpy(dtype=float)[valid]
+    if len(values) == 0 or len(thresholds) == 0:
+        return pd.DataFrame(columns=BREADTH_COLUMNS)
+
+    # Lay the days end to end on one axis: day c occupies [c * width, c * width + span]
+    low = values.min()
+    span = values.max() - low
+    width = span + 1
+    keys = np.sort(codes * width + (values - low))
+
+    base = np.arange(len(dates))[:, None] * width
+    starts = np.searchsorted(keys, base[:, 0], side="left")
+    totals = np.bincount(codes, minlength=len(dates))[:, None]
+
+    # Queries are clipped into each day's band so they never spill into the next
+    up = starts[:, None] + totals - np.searchsorted(
+        keys, base + np.clip(thresholds - low, 0, span + 0.5), side="left"
+    )
+    down = np.searchsorted(
+        keys, base + np.clip(-thresholds - low, -0.5, span), side="right"
+    ) - starts[:, None]
+
+    result = pd.DataFrame({
+        "date": np.repeat(dates, len(thresholds)),
+        "threshold": np.tile(thresholds, len(dates)),
+        "up": up.ravel(),
+        "down": down.ravel(),
+        "total": np.repeat(totals[:, 0], len(thresholds)),
+    })
+    result["up_pct"] = result["up"] / result["total"] * 100
+    result["down_pct"] = result["down"] / result["total"] * 100
+    return result[BREADTH_COLUMNS]
+
+
+def breadth(changes, thresholds=DEFAULT_THRESHOLDS):
+    """Breadth for a single day's % changes, one row per threshold."""
+    day = pd.DataFrame({"date": 0, "pct_change": pd.Series(changes).to_numpy()})
+    return daily_breadth(day, thresholds).drop(columns="date")
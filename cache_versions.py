@@ -0,0 +1,19 @@
+import threading
+
+# Process-wide write counters, one per table. Cached loaders take the
+# version of the table they read as an argument, so a write to one table
+# invalidates only the cache entries built from it.
+_versions = {}
+_lock = threading.Lock()
+
+
+def table_version(table_name):
+    """Current version of ``table_name`` (0 until its first write)."""
+    return _versions.get(table_name, 0)
+
+
+def bump_version(table_name):
+    """Mark ``table_name`` as changed; returns the new version."""
+    with _lock:
+        _versions[table_name] = _versions.get(table_name, 0) + 1
+        return _versions[table_name]
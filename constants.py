@@ -0,0 +1,34 @@
+"""Names shared by the pages and the headless data modules.
+
+Data modules (sector_breadth, sma_engine, indicators, ...) import these
+from here rather than from the Streamlit page modules, so the poller and
+backfill never load page code.
+"""
+import pandas as pd
+
+# Sectors used by pos.py, sma.py and sector_data
+SECTORS = [
+    "Hydropower", "C. Bank", "D. Bank", "Finance", "Hotels",
+    "Microfinance", "Investments", "Life insurance", "Non-life insurance",
+    "Others", "Manufacture", "Tradings"
+]
+
+# sector_data / sma_data column names
+DATE_COL = 'date'
+SECTOR_COL = 'sector'
+
+# sma_data table and its moving-average columns
+SMA_TABLE = "sma_data"
+SMA_COLUMNS = ['10_SMA', '20_SMA', '50_SMA', '200_SMA']
+
+
+def get_label(value):
+    """Determine label based on threshold values."""
+    if value is None or pd.isna(value):
+        return "unknown"
+    if value >= 60:
+        return "strong"
+    elif value >= 50:
+        return "mid"
+    else:
+        return "weak"
@@ -0,0 +1,130 @@
+"""Date-versioned sector constituent counts.
+
+The number of listed stocks per sector is derived from the symbols scraped
+each day (stock_quotes) and their sectors (symbol_sectors). Only change
+points are stored in sector_constituents: a row means "from this date on,
+the sector has this many stocks". Lookups for any set of dates are a
+forward fill over those points, so callers get a full date x sector matrix
+in one step.
+"""
+import logging
+
+import pandas as pd
+
+from sector_breadth import SECTOR_CALC_KEYS
+from storage import WRITE_CHUNK_SIZE
+from sync_cache import sync_table
+
+REGISTRY_TABLE = "sector_constituents"
+REGISTRY_COLUMNS = ["sector", "date", "stock_count"]
+
+
+def daily_constituents(quotes, mapping):
+    """Number of mapped symbols listed on each date, per sector.
+
+    Every mapped sector gets a row for every date, so a sector whose last
+    listed symbol drops out is recorded as a change to zero.
+    """
+    listed = quotes[["date", "symbol"]].drop_duplicates().merge(mapping, on="symbol", how="inner")
+    listed = listed[listed["sector"].isin(SECTOR_CALC_KEYS)]
+    counts = listed.groupby(["sector", "date"]).size().rename("stock_count")
+    sectors = sorted(set(mapping["sector"]) & set(SECTOR_CALC_KEYS))
+    dates = sorted(quotes["date"].unique())
+    if not sectors or not dates:
+        return counts.reset_index()
+    full_index = pd.MultiIndex.from_product([sectors, dates], names=["sector", "date"])
+    return counts.reindex(full_index, fill_value=0).reset_index()
+
+
+def change_points(daily):
+    """Keep only the rows where a sector's count differs from its previous day."""
+    daily = daily.sort_values(["sector", "date"], kind="stable")
+    changed = daily["stock_count"].ne(daily.groupby("sector")["stock_count"].shift())
+    return daily[changed].reset_index(drop=True)
+
+
+def load_registry(store, max_age=0):
+    """The stored change points as a (sector, date, stock_count) frame."""
+    registry = sync_table(REGISTRY_TABLE).load(store, max_age=max_age)
+    if registry.empty:
+        return pd.DataFrame(columns=REGISTRY_COLUMNS)
+    return registry[REGISTRY_COLUMNS]
+
+
+def rebuild_registry(store, quotes, mapping):
+    """Recompute every change point from the given quotes and replace the registry."""
+    points = change_points(daily_constituents(quotes, mapping))
+    points["date"] = points["date"].astype(str)
+    existing = load_registry(store)
+
+    records = points.to_dict("records")
+    for start in range(0, len(records), WRITE_CHUNK_SIZE):
+        response = store.table(REGISTRY_TABLE)\
+            .upsert(records[start:start + WRITE_CHUNK_SIZE], on_conflict="sector,date")\
+            .execute()
+        sync_table(REGISTRY_TABLE).apply_rows(response.data)
+
+    # Drop points that no longer mark a change
+    keep = set(zip(points["sector"], points["date"]))
+    for sector, stale in existing.groupby("sector"):
+        dates = [str(date) for date in stale["date"] if (sector, str(date)) not in keep]
+        if dates:
+            response = store.table(REGISTRY_TABLE)\
+                .delete()\
+                .eq("sector", sector)\
+                .in_("date", dates)\
+                .execute()
+            sync_table(REGISTRY_TABLE).apply_deletes(response.data)
+    logging.info(f"Constituent registry rebuilt: {len(points)} change point(s)")
+    return len(points)
+
+
+def update_registry(store, quotes, mapping, all_quotes=None):
+    """Record a newly scraped day's counts, adding change points where needed.
+
+    Days after the latest change point are appended incrementally. An
+    older day can shift later points, so ``all_quotes`` (a callable
+    returning every stored day) is then used to rebuild the registry.
+    """
+    daily = daily_constituents(quotes, mapping)
+    if daily.empty:
+        return 0
+    daily["date"] = daily["date"].astype(str)
+    registry = load_registry(store)
+    registry = registry.assign(date=registry["date"].astype(str))
+
+    if not registry.empty and daily["date"].min() < registry["date"].max():
+        if all_quotes is None:
+            return 0
+        return rebuild_registry(store, all_quotes(), mapping)
+
+    # Compare against each sector's latest point; only the new days can change
+    latest = registry.sort_values("date").groupby("sector").tail(1)
+    points = change_points(pd.concat([latest, daily], ignore_index=True))
+    points = points.merge(daily[["sector", "date"]], on=["sector", "date"])
+    if points.empty:
+        return 0
+    response = store.table(REGISTRY_TABLE)\
+        .upsert(points.to_dict("records"), on_conflict="sector,date")\
+        .execute()
+    sync_table(REGISTRY_TABLE).apply_rows(response.data)
+    return len(points)
+
+
+def counts_for_dates(registry, dates):
+    """Constituent counts for every date, keyed by sector_calc column.
+
+    Returns a frame indexed like ``dates`` with one column per sector;
+    dates before a sector's first change point are NaN.
+    """
+    dates = pd.to_datetime(pd.Series(dates))
+    columns = list(SECTOR_CALC_KEYS.values())
+    if registry.empty:
+        return pd.DataFrame(index=dates.index, columns=columns, dtype=float)
+
+    points = registry.assign(date=pd.to_datetime(registry["date"]))\
+        .pivot(index="date", columns="sector", values="stock_count")\
+        .rename(columns=SECTOR_CALC_KEYS)\
+        .reindex(columns=columns)
+    lookup = points.reindex(points.index.union(dates.dropna().unique())).sort_index().ffill()
+    return lookup.reindex(dates).set_axis(dates.index).astype(float)
@@ -0,0 +1,141 @@
+"""Parser backends for the Sharesansar trading table.
+
+Each backend returns ``(date_text, headers, rows)`` for a page: the text of
+the ``span#dDate`` element, the ``th`` texts of the first ``table.table``
+header, and one list of ``td`` texts per body row, all stripped. A table
+without a ``thead`` or ``tbody`` raises ValueError. Backends must produce
+identical output; tests/test_html_parsers.py and benchmarks/bench_parser.py
+check this on the stored sample pages.
+"""
+import html as html_lib
+import os
+import re
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+
+# Backend used when none is requested: "fast" or "bs4"
+DEFAULT_PARSER = os.environ.get("NEPSE_HTML_PARSER", "fast")
+
+
+class SoupTableParser:
+    """Reference backend: full BeautifulSoup tree with html.parser."""
+
+    name = "bs4"
+
+    def parse(self, page):
+        soup = BeautifulSoup(page, "html.parser")
+        date_element = soup.find("span", {"id": "dDate"})
+        date_text = date_element.text.strip() if date_element else None
+
+        table = soup.find('table', class_='table')
+        if not table:
+            return date_text, None, None
+
+        thead, tbody = table.find('thead'), table.find('tbody')
+        if thead is None or tbody is None:
+            raise ValueError("Trading table has no thead or tbody")
+        headers = [th.text.strip() for th in thead.find_all('th')]
+        rows = [[td.text.strip() for td in row.find_all('td')] for row in tbody.find_all('tr')]
+        return date_text, headers, rows
+
+
+class FastTableParser:
+    """Streaming backend that never builds a tree.
+
+    Regexes locate ``span#dDate`` and the first ``table.table``; only that
+    table's markup is fed to a small event parser that collects cell text.
+    """
+
+    name = "fast"
+
+    # Attribute values may be double-quoted, single-quoted or unquoted
+    _DATE_RE = re.compile(
+        r"<span\b[^>]*\bid\s*=\s*(?:\"dDate\"|'dDate'|dDate(?=[\s/>]))[^>]*>(.*?)</span\s*>", re.I | re.S
+    )
+    _TABLE_RE = re.compile(
+        r"<table\b[^>]*\bclass\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'=<>`]+))[^>]*>", re.I
+    )
+    _TAG_RE = re.compile(r"<[^>]+>")
+
+    def parse(self, page):
+        date_match = self._DATE_RE.search(page)
+        date_text = None
+        if date_match:
+            date_text = html_lib.unescape(self._TAG_RE.sub("", date_match.group(1))).strip()
+
+        for table_match in self._TABLE_RE.finditer(page):
+            classes = next(group for group in table_match.groups() if group is not None)
+            if "table" in classes.split():
+                break
+        else:
+            return date_text, None, None
+
+        end = page.find("</table", table_match.end())
+        collector = _CellCollector()
+        collector.feed(page[table_match.end():end if end != -1 else len(page)])
+        collector.close()
+        if not (collector.seen_thead and collector.seen_tbody):
+            raise ValueError("Trading table has no thead or tbody")
+        return date_text, collector.headers, collector.rows
+
+
+class _CellCollector(HTMLParser):
+    """Collect th text from thead and td text per tr from tbody.
+
+    Unclosed cells nest like they do in the BeautifulSoup tree: an outer
+    cell's text includes every cell opened inside it.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headers = []
+        self.rows = []
+        self._section = None
+        self._open = []  # (target list, slot, text parts) for each open cell
+        self.seen_thead = False
+        self.seen_tbody = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("thead", "tbody"):
+            self._close_cells()
+            self._section = tag
+            setattr(self, f"seen_{tag}", True)
+        elif tag == "tr" and self._section == "tbody":
+            self._close_cells()
+            self.rows.append([])
+        elif (tag == "th" and self._section == "thead") or (tag == "td" and self._section == "tbody" and self.rows):
+            target = self.headers if tag == "th" else self.rows[-1]
+            target.append(None)
+            self._open.append((target, len(target) - 1, []))
+
+    def handle_endtag(self, tag):
+        if tag in ("th", "td") and self._open:
+            self._close_cell()
+        elif tag in ("tr", "thead", "tbody"):
+            self._close_cells()
+            if tag != "tr":
+                self._section = None
+
+    def handle_data(self, data):
+        for _, _, parts in self._open:
+            parts.append(data)
+
+    def _close_cell(self):
+        target, slot, parts = self._open.pop()
+        target[slot] = "".join(parts).strip()
+
+    def _close_cells(self):
+        while self._open:
+            self._close_cell()
+
+
+PARSERS = {parser.name: parser for parser in (FastTableParser, SoupTableParser)}
+
+
+def get_parser(name=None):
+    """Return an instance of the named parser backend (default: NEPSE_HTML_PARSER)."""
+    name = name or DEFAULT_PARSER
+    if name not in PARSERS:
+        raise ValueError(f"Unknown HTML parser: {name} (choose from {', '.join(PARSERS)})")
+    return PARSERS[name]()
@@ -0,0 +1,233 @@
+"""Incremental rolling indicators with persisted window state.
+
+Each series (e.g. Hydropower's Positive % in sector_data) keeps, for every
+window in SMA_COLUMNS, its running sum and a ring buffer of the last N
+values in the indicator_state table. A new trading day is then one O(1)
+update per window instead of a reload and recompute of the full history.
+"""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from constants import DATE_COL, SECTOR_COL, SMA_TABLE
+from sma_engine import DEFAULT_SOURCE, SMA_WINDOWS, recompute_smas
+from sync_cache import sync_table
+
+STATE_TABLE = "indicator_state"
+
+
+class RollingWindow:
+    """Running sum and ring buffer of the last ``size`` values.
+
+    Missing values occupy a slot but are left out of the sum; the mean is
+    only defined once the window holds ``size`` non-missing values.
+    """
+
+    def __init__(self, size, values=(), total=None):
+        self.size = int(size)
+        self.buffer = deque((None if v is None or pd.isna(v) else float(v) for v in values), maxlen=self.size)
+        self.total = float(total) if total is not None else self._sum()
+        self.valid = sum(v is not None for v in self.buffer)
+        self._pushes = 0
+
+    def push(self, value):
+        """Add the newest value, dropping the oldest once full."""
+        value = None if value is None or pd.isna(value) else float(value)
+        if len(self.buffer) == self.size:
+            self._remove(self.buffer[0])
+        self.buffer.append(value)
+        self._add(value)
+        self._rebase()
+
+    def replace_last(self, value):
+        """Overwrite the newest value (a day re-scraped later the same day)."""
+        if not self.buffer:
+            self.push(value)
+            return
+        self._remove(self.buffer[-1])
+        value = None if value is None or pd.isna(value) else float(value)
+        self.buffer[-1] = value
+        self._add(value)
+
+    @property
+    def mean(self):
+        if self.valid < self.size:
+            return None
+        return self.total / self.size
+
+    def _add(self, value):
+        if value is not None:
+            self.total += value
+            self.valid += 1
+
+    def _remove(self, value):
+        if value is not None:
+            self.total -= value
+            self.valid -= 1
+
+    def _rebase(self):
+        # Re-add the buffer once per window length so floating-point drift
+        # stays bounded, at an amortized O(1) cost
+        self._pushes += 1
+        if self._pushes >= self.size:
+            self.total = self._sum()
+            self._pushes = 0
+
+    def _sum(self):
+        return float(sum(v for v in self.buffer if v is not None))
+
+
+class SeriesState:
+    """Rolling windows for one series, one per SMA column."""
+
+    def __init__(self, name, windows=None, last_date=None):
+        self.name = name
+        self.windows = windows or {col: RollingWindow(size) for col, size in SMA_WINDOWS.items()}
+        self.last_date = last_date
+
+    def append(self, date, value):
+        """Apply one day's value; returns the SMA values after it.
+
+        The latest day may be sent again (it replaces the stored value);
+        days older than ``last_date`` raise ValueError so the caller can
+        rebuild from history instead.
+        """
+        if self.last_date is not None and date < self.last_date:
+            raise ValueError(f"{self.name}: {date} is before {self.last_date}")
+        for window in self.windows.values():
+            if date == self.last_date:
+                window.replace_last(value)
+            else:
+                window.push(value)
+        self.last_date = date
+        return self.values()
+
+    def values(self):
+        return {col: window.mean for col, window in self.windows.items()}
+
+    def records(self):
+        return [
+            {
+                "series": self.name,
+                "window_size": window.size,
+                "total": window.total,
+                "buffer": list(window.buffer),
+                "last_date": self.last_date,
+            }
+            for window in self.windows.values()
+        ]
+
+    @classmethod
+    def from_history(cls, name, values, last_date):
+        """Seed the state from a series' full history, oldest first."""
+        values = list(values)
+        windows = {col: RollingWindow(size, values[-size:]) for col, size in SMA_WINDOWS.items()}
+        return cls(name, windows, last_date)
+
+
+def series_name(sector, value_col=DEFAULT_SOURCE):
+    """State key for a sector_data series."""
+    return f"sector_data:{sector}:{value_col}"
+
+
+def load_states(store, names):
+    """Load persisted states by series name; missing series are left out."""
+    if not names:
+        return {}
+    response = store.table(STATE_TABLE)\
+        .select("series,window_size,total,buffer,last_date")\
+        .in_("series", list(names))\
+        .execute()
+    rows = {}
+    for row in response.data or []:
+        rows.setdefault(row["series"], []).append(row)
+
+    states = {}
+    sizes = {size: col for col, size in SMA_WINDOWS.items()}
+    for name, series_rows in rows.items():
+        windows = {
+            sizes[row["window_size"]]: RollingWindow(row["window_size"], row["buffer"] or [], row["total"])
+            for row in series_rows if row["window_size"] in sizes
+        }
+        # Only complete states are usable; partial ones are rebuilt
+        if len(windows) == len(SMA_WINDOWS):
+            states[name] = SeriesState(name, windows, series_rows[0]["last_date"])
+    return states
+
+
+def save_states(store, states):
+    """Persist states with one bulk upsert."""
+    records = [record for state in states for record in state.records()]
+    if records:
+        store.table(STATE_TABLE).upsert(records, on_conflict="series,window_size").execute()
+
+
+def rebuild_sector_states(store, value_col=DEFAULT_SOURCE, max_age=0):
+    """Seed every sector's state from the full sector_data history."""
+    history = _sector_history(store, value_col, max_age)
+    states = [
+        SeriesState.from_history(series_name(sector, value_col), group[value_col], group[DATE_COL].iloc[-1])
+        for sector, group in history.groupby(SECTOR_COL)
+    ]
+    save_states(store, states)
+    return len(states)
+
+
+def advance_sector_smas(store, counts, value_col=DEFAULT_SOURCE):
+    """Update SMAs for newly counted sector days without recomputing history.
+
+    ``counts`` holds the new sector_data rows (sector, date, value). Sectors
+    without a usable state are seeded from history first; a day older than
+    a sector's state falls back to a full recompute. Returns the sma_data
+    rows written.
+    """
+    if counts.empty:
+        return 0
+
+    counts = counts.assign(**{DATE_COL: pd.to_datetime(counts[DATE_COL]).dt.strftime("%Y-%m-%d")})\
+        .sort_values([SECTOR_COL, DATE_COL])
+    names = {sector: series_name(sector, value_col) for sector in counts[SECTOR_COL].unique()}
+    states = load_states(store, names.values())
+
+    # A day older than a sector's state changes every later SMA as well
+    if any(
+        names[sector] in states and states[names[sector]].last_date is not None
+        and date < states[names[sector]].last_date
+        for sector, date in zip(counts[SECTOR_COL], counts[DATE_COL])
+    ):
+        return recompute_smas(store, value_col)
+
+    history = None
+    sma_rows = []
+    for sector, group in counts.groupby(SECTOR_COL):
+        state = states.get(names[sector])
+        if state is None:
+            if history is None:
+                history = _sector_history(store, value_col)
+            earlier = history[(history[SECTOR_COL] == sector) & (history[DATE_COL] < group[DATE_COL].iloc[0])]
+            state = SeriesState.from_history(
+                names[sector], earlier[value_col], earlier[DATE_COL].iloc[-1] if not earlier.empty else None
+            )
+            states[names[sector]] = state
+
+        for date, value in zip(group[DATE_COL], group[value_col]):
+            sma_rows.append({SECTOR_COL: sector, DATE_COL: date, **state.append(date, value)})
+
+    response = store.table(SMA_TABLE)\
+        .upsert(sma_rows, on_conflict="sector,date")\
+        .execute()
+    sync_table(SMA_TABLE).apply_rows(response.data)
+    save_states(store, states.values())
+    return len(sma_rows)
+
+
+def _sector_history(store, value_col, max_age=0):
+    history = sync_table("sector_data").load(store, max_age=max_age)
+    if history.empty:
+        return pd.DataFrame(columns=[SECTOR_COL, DATE_COL, value_col])
+    history[DATE_COL] = pd.to_datetime(history[DATE_COL], errors="coerce").dt.strftime("%Y-%m-%d")
+    history[value_col] = pd.to_numeric(history[value_col], errors="coerce").astype(float)
+    return history.dropna(subset=[DATE_COL])\
+        .replace({np.nan: None})\
+        .sort_values([SECTOR_COL, DATE_COL])
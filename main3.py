@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+from shared_data import shared_dataset
 
 # Configuration
 PERSISTENT_FILE = "nepse_data.csv"
@@ -9,7 +10,8 @@ PERSISTENT_FILE = "nepse_data.csv"
 # Set up page config
 
 
-# Initialize session state for data persistence
+# Session state holds only an uploaded file's data; the persistent file is
+# read once per change and shared by all sessions (see shared_data.py)
 if 'raw_data' not in st.session_state:
     st.session_state.raw_data = None
 
@@ -27,6 +29,23 @@ def save_nepse_data(df):
     """Save NEPSE data to persistent storage"""
     df.to_csv(PERSISTENT_FILE, index=False)
 
+def prepare_nepse_data(df):
+    """Return a copy with numeric 'Positive' and its sentiment_strength"""
+    df = df.copy()
+    if 'Positive' in df.columns:
+        df['Positive'] = pd.to_numeric(df['Positive'], errors='coerce')
+        df['sentiment_strength'] = df['Positive'].apply(categorize_sentiment)
+    return df
+
+def load_shared_nepse_data():
+    """Persistent NEPSE data, prepared once per file change for all sessions"""
+    version = os.path.getmtime(PERSISTENT_FILE) if os.path.exists(PERSISTENT_FILE) else None
+
+    def build():
+        df = load_nepse_data()
+        return prepare_nepse_data(df) if df is not None else None
+    return shared_dataset("main3.nepse_data", version, build)
+
 # Categorize sentiment based on positive values
 def categorize_sentiment(positive):
     """Categorize sentiment based on positive values"""
@@ -44,36 +63,29 @@ def main():
     # File uploader
     uploaded_file = st.file_uploader("📤 Upload NEPSE Data", type=['csv'])
 
-    # Load data into session state
+    # An upload is this session's own copy; otherwise read the shared file
     if uploaded_file:
-        st.session_state.raw_data = pd.read_csv(uploaded_file)
-    elif st.session_state.raw_data is None:
-        st.session_state.raw_data = load_nepse_data()
+        st.session_state.raw_data = prepare_nepse_data(pd.read_csv(uploaded_file))
+    raw_data = st.session_state.raw_data
+    if raw_data is None:
+        raw_data = load_shared_nepse_data()
 
-    if st.session_state.raw_data is None:
+    if raw_data is None:
         st.warning("Please upload a CSV file to begin analysis")
         return
 
-    # Ensure 'Positive' column exists and is numeric
-    if 'Positive' in st.session_state.raw_data.columns:
-        st.session_state.raw_data['Positive'] = pd.to_numeric(
-            st.session_state.raw_data['Positive'], errors='coerce'
-        )
-        st.session_state.raw_data['sentiment_strength'] = st.session_state.raw_data['Positive'].apply(
-            categorize_sentiment
-        )
-
     # Data editor
     with st.expander("✏️ Data Editor", expanded=False):
         edited_data = st.data_editor(
-            st.session_state.raw_data.drop(columns=['sentiment_strength'], errors='ignore'),
+            raw_data.drop(columns=['sentiment_strength'], errors='ignore'),
             num_rows="dynamic"
         )
 
         # Save button
         if st.button("💾 Update Dataset"):
-            st.session_state.raw_data = edited_data
-            save_nepse_data(st.session_state.raw_data)
+            save_nepse_data(edited_data)
+            # The saved file is now the shared copy every session reads
+            st.session_state.raw_data = None
             st.success("✅ Dataset updated successfully!")
             st.rerun()  # Force rerun to update visualizations immediately
 
@@ -82,9 +94,9 @@ def main():
 
     with col1:
         st.write("📊 Sentiment Distribution")
-        if 'sentiment_strength' in st.session_state.raw_data.columns:
+        if 'sentiment_strength' in raw_data.columns:
             fig = px.pie(
-                st.session_state.raw_data,
+                raw_data,
                 names='sentiment_strength',
                 title="Sentiment Strength Distribution"
             )
@@ -92,9 +104,9 @@ def main():
 
     with col2:
         st.write("📈 Positive Sentiment Timeline")
-        if 'Positive' in st.session_state.raw_data.columns:
+        if 'Positive' in raw_data.columns:
             fig = px.line(
-                st.session_state.raw_data,
+                raw_data,
                 x='DATE',
                 y='Positive',
                 title="Positive Sentiment Over Time",
@@ -104,9 +116,9 @@ def main():
 
     # Detailed sentiment analysis
     st.write("🔍 Detailed Sentiment Analysis")
-    if 'sentiment_strength' in st.session_state.raw_data.columns:
+    if 'sentiment_strength' in raw_data.columns:
         st.dataframe(
-            st.session_state.raw_data[['DATE', 'Positive', 'sentiment_strength']].sort_values('DATE', ascending=False),
+            raw_data[['DATE', 'Positive', 'sentiment_strength']].sort_values('DATE', ascending=False),
             height=300,
             use_container_width=True
         )
@@ -1,13 +1,36 @@
+import threading
+
 import streamlit as st
-from pos import main as POS
-from main2 import main as sector_value_analysis
-from main import main as calculator
+
+# Set page config FIRST and ONLY ONCE
+st.set_page_config(
+    page_title="Surakshya Investments",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Pages are imported only when selected, so a cold start pays for the
+# dashboard alone rather than every page's module setup
+def pos_app():
+    from pos import main as POS
+    return POS()
+
+def sector_value_analysis():
+    from main2 import main as sector_value_main
+    return sector_value_main()
+
+def calculator():
+    from main import main as calculator_main
+    return calculator_main()
+
 def web_scrapping_app():
     from app import main as web_scrapping_main  # Import here to avoid circular dependency
     return web_scrapping_main()
-from sma import main as sma_analysis
 
-# Set page config FIRST and ONLY ONCE
+def sma_analysis():
+    from sma import main as sma_main
+    return sma_main()
 
 def dashboard():
     col1, col2 = st.columns([1, 3])
@@ -77,13 +100,14 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Navigation configuration
+# "tables" lists the datasets each page reads, for background prefetching
 NAV_ITEMS = {
-    0: {"title": "Dashboard", "icon": "🏠"},
-    1: {"title": "POS", "icon": "💬"},
-    2: {"title": "Sectors", "icon": "📊"},
-    3: {"title": "Calculator", "icon": "🧮"},
-    4: {"title": "Web Data", "icon": "🌐"},
-    5: {"title": "SMA", "icon": "📉"}
+    0: {"title": "Dashboard", "icon": "🏠", "tables": []},
+    1: {"title": "POS", "icon": "💬", "tables": ["sector_data", "nepse_equity"]},
+    2: {"title": "Sectors", "icon": "📊", "tables": ["sector_weights"]},
+    3: {"title": "Calculator", "icon": "🧮", "tables": ["sector_calc"]},
+    4: {"title": "Web Data", "icon": "🌐", "tables": []},
+    5: {"title": "SMA", "icon": "📉", "tables": ["sma_data"]}
 }
 
 # Session state initialization
@@ -107,11 +131,11 @@ def render_nav():
 def render_page():
     pages = [
     dashboard,
-    lambda: POS(),
-    lambda: sector_value_analysis(),
-    lambda: calculator(),
-    lambda: web_scrapping_app(),  # This now calls the helper function
-    lambda: sma_analysis()
+    pos_app,
+    sector_value_analysis,
+    calculator,
+    web_scrapping_app,
+    sma_analysis
 ]
     
     container = st.container()
@@ -119,12 +143,31 @@ def render_page():
         pages[st.session_state.current_page]()
         st.markdown("---")
 
+# Background loader for the other pages' datasets. The data modules are
+# imported on the worker thread too, so the dashboard never waits on them.
+def prefetch_other_pages():
+    tables = [
+        table
+        for key, item in NAV_ITEMS.items() if key != st.session_state.current_page
+        for table in item["tables"]
+    ]
+    threading.Thread(target=_prefetch, args=(tables,), daemon=True).start()
+
+def _prefetch(tables):
+    from prefetch import prefetch_tables
+    from storage import get_store
+    prefetch_tables(get_store(), tables)
+
 # App entry point
 def main():
     st.markdown("<div class='nav-container'>", unsafe_allow_html=True)
     render_nav()
     st.markdown("</div>", unsafe_allow_html=True)
     render_page()
+    # The dashboard has already been sent to the browser; warm the other
+    # pages so switching to them doesn't block on the database
+    if st.session_state.current_page == 0:
+        prefetch_other_pages()
 
 if __name__ == "__main__":
     main()
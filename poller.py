@@ -0,0 +1,96 @@
+"""Headless intraday poller for the live-trading page.
+
+Fetches the live table on an interval during NEPSE trading hours, hashes
+the parsed table and stores a snapshot (keyed by the page's dDate
+timestamp) only when the table changed. The day's raw_stock_data row is
+refreshed alongside, so it always holds the latest snapshot.
+
+    python poller.py --interval 60
+"""
+import argparse
+import hashlib
+import logging
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+
+import pandas as pd
+
+from app import StockDataManager
+from backfill import NON_TRADING_WEEKDAYS
+
+# Nepal Standard Time has no daylight saving, so a fixed offset is exact
+NEPAL_TZ = timezone(timedelta(hours=5, minutes=45))
+MARKET_OPEN = dt_time(11, 0)
+MARKET_CLOSE = dt_time(15, 0)
+
+
+def table_hash(df):
+    """Content hash of a parsed table (headers and cell values, in order)."""
+    digest = hashlib.sha256("\x1f".join(df.columns).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def is_trading_time(now=None):
+    """True during NEPSE trading hours (Sunday to Thursday, 11:00-15:00 NPT)."""
+    now = now or datetime.now(NEPAL_TZ)
+    return now.weekday() not in NON_TRADING_WEEKDAYS and MARKET_OPEN <= now.time() <= MARKET_CLOSE
+
+
+class IntradayPoller:
+    """Poll the live page and keep only snapshots whose table changed."""
+
+    def __init__(self, manager=None, interval=60, trading_hours_only=True):
+        self.manager = manager or StockDataManager()
+        self.interval = interval
+        self.trading_hours_only = trading_hours_only
+        # Resume change detection from the last stored snapshot
+        self.last_hash = self.manager.db_manager.get_latest_snapshot_hash()
+
+    def poll_once(self):
+        """Fetch once; returns True when a new snapshot was stored."""
+        df, scraped_at = self.manager.scrape_snapshot()
+        if df is None:
+            return False
+
+        current_hash = table_hash(df)
+        if current_hash == self.last_hash:
+            logging.info(f"Poll {scraped_at}: no change")
+            return False
+
+        if not self.manager.db_manager.save_snapshot(df, scraped_at, current_hash):
+            return False
+        self.manager.save_stock_data(df, 'raw', scraped_at)
+        self.last_hash = current_hash
+        logging.info(f"Poll {scraped_at}: stored snapshot {current_hash[:12]}")
+        return True
+
+    def run(self, max_polls=None):
+        """Poll until interrupted (or ``max_polls`` fetches have been made)."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            if not self.trading_hours_only or is_trading_time():
+                try:
+                    self.poll_once()
+                except Exception as e:
+                    logging.error(f"Poll failed: {e}")
+                polls += 1
+            time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll the live-trading page and store changed snapshots.")
+    parser.add_argument("--interval", type=float, default=60, help="seconds between polls")
+    parser.add_argument("--always", action="store_true", help="poll outside trading hours too")
+    args = parser.parse_args()
+
+    poller = IntradayPoller(interval=args.interval, trading_hours_only=not args.always)
+    try:
+        poller.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
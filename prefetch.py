@@ -0,0 +1,35 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sync_cache import SYNC_MAX_AGE, sync_table
+
+# Background loads share one small pool per process; page reruns never
+# queue a second load of a table that is already being fetched.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+_in_flight = {}
+_lock = threading.Lock()
+
+
+def prefetch_tables(store, tables):
+    """Start loading ``tables`` into their shared sync caches in parallel.
+
+    Returns immediately with the futures; the pages later read the warm
+    copies through ``sync_table(...).load``.
+    """
+    futures = {}
+    with _lock:
+        for table_name in tables:
+            future = _in_flight.get(table_name)
+            if future is None or future.done():
+                future = _executor.submit(_load_table, store, table_name)
+                _in_flight[table_name] = future
+            futures[table_name] = future
+    return futures
+
+
+def _load_table(store, table_name):
+    try:
+        sync_table(table_name).load(store, max_age=SYNC_MAX_AGE)
+    except Exception as e:
+        logging.error(f"Prefetch of {table_name} failed: {e}")
@@ -0,0 +1,90 @@
+"""Row-level diff between two snapshots of an editable table.
+
+Rows are matched on their key columns (a date, or sector and date) and
+compared by a hash of their value columns, computed for whole frames at
+once with ``pd.util.hash_pandas_object``. The diff is O(n) in the number of
+rows and hands back only the rows that need writing.
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+RowDiff = namedtuple("RowDiff", ["inserts", "updates", "deletes"])
+
+
+def diff_rows(previous, edited, key_columns, value_columns=None):
+    """Compare two frames by key; returns RowDiff(inserts, updates, deletes).
+
+    ``inserts`` and ``updates`` are rows of ``edited`` (keys missing from
+    ``previous``, and keys whose values changed); ``deletes`` are rows of
+    ``previous`` whose keys are gone. Rows with a missing key are ignored,
+    and a key edited twice keeps its last row. Values are compared after
+    normalizing numbers to float and dates to YYYY-MM-DD, so a reload that
+    changes dtypes alone does not count as an edit.
+    """
+    key_columns = list(key_columns)
+    if value_columns is None:
+        value_columns = [col for col in edited.columns if col not in key_columns]
+    value_columns = list(value_columns)
+
+    previous = _prepare(previous, key_columns, value_columns)
+    edited = _prepare(edited, key_columns, value_columns)
+
+    previous_keys = _key_index(previous, key_columns)
+    edited_keys = _key_index(edited, key_columns)
+
+    existing = edited_keys.isin(previous_keys)
+    previous_hashes = pd.Series(_row_hashes(previous, value_columns), index=previous_keys)
+    edited_hashes = _row_hashes(edited, value_columns)
+    changed = existing.copy()
+    changed[existing] = previous_hashes.reindex(edited_keys[existing]).to_numpy() != edited_hashes[existing]
+
+    return RowDiff(
+        inserts=edited[~existing].reset_index(drop=True),
+        updates=edited[changed].reset_index(drop=True),
+        deletes=previous[~previous_keys.isin(edited_keys)].reset_index(drop=True),
+    )
+
+
+def _prepare(df, key_columns, value_columns):
+    if df is None:
+        return pd.DataFrame(columns=key_columns + value_columns)
+    df = df.dropna(subset=key_columns)
+    return df[~_key_index(df, key_columns).duplicated(keep="last")]
+
+
+def _key_index(df, key_columns):
+    return pd.MultiIndex.from_arrays(
+        [_normalize(df[col]).astype(str) for col in key_columns], names=key_columns
+    )
+
+
+def _row_hashes(df, value_columns):
+    normalized = pd.DataFrame({col: _normalize(df[col]) for col in value_columns}, index=df.index)
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def _normalize(values):
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values.astype(float)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d")
+    # Editors hand back date objects and numbers typed as text
+    converted = pd.to_datetime(values, errors="coerce", format="mixed") if _looks_like_dates(values) else None
+    if converted is not None and converted.notna().sum() == values.notna().sum():
+        return converted.dt.strftime("%Y-%m-%d")
+    # None counts as NaN, so a column of JSON nulls (an empty SMA column) is
+    # numeric and hashes the same as NaN or as the column after one number
+    # is typed into it
+    numbers = pd.to_numeric(values, errors="coerce")
+    if numbers.notna().sum() == values.notna().sum():
+        return numbers.astype(float)
+    return values.astype(object).where(values.notna(), None).astype(str)
+
+
+def _looks_like_dates(values):
+    sample = values.dropna()
+    return not sample.empty and all(
+        hasattr(value, "year") or (isinstance(value, str) and len(value) >= 8 and value[4:5] == "-")
+        for value in sample.iloc[:5]
+    )
@@ -0,0 +1,86 @@
+"""Cross-day Performance_Score panel.
+
+Scores every stored day at once with the same rule as
+``StockDataManager.process_stock_data``: keep stocks with % change at or
+above the threshold and volume above that day's median, min-max normalize
+change and volume within the day, and weight them 0.6 / 0.4. All per-day
+statistics come from grouped transforms, so a month or a year is one pass.
+"""
+import pandas as pd
+
+CHANGE_WEIGHT = 0.6
+VOLUME_WEIGHT = 0.4
+
+
+def score_panel(quotes, change_threshold=4, change_weight=CHANGE_WEIGHT, volume_weight=VOLUME_WEIGHT):
+    """Score long-form (date, symbol, pct_change, volume) quotes for every day.
+
+    Returns the qualifying rows with ``score`` and the within-day ``rank``
+    (1 = best), ordered by date and rank.
+    """
+    data = quotes[["date", "symbol", "pct_change", "volume"]].copy()
+    data["pct_change"] = pd.to_numeric(data["pct_change"], errors="coerce")
+    data["volume"] = pd.to_numeric(data["volume"], errors="coerce")
+
+    # The volume median is taken over the whole day, before filtering
+    median_volume = data.groupby("date")["volume"].transform("median")
+    data = data[(data["pct_change"] >= change_threshold) & (data["volume"] > median_volume)]
+
+    days = data.groupby("date")
+    for col, name in (("pct_change", "norm_change"), ("volume", "norm_volume")):
+        low = days[col].transform("min")
+        high = days[col].transform("max")
+        data[name] = (data[col] - low) / (high - low)
+
+    data["score"] = change_weight * data["norm_change"] + volume_weight * data["norm_volume"]
+    data["rank"] = data.groupby("date")["score"].rank(method="first", ascending=False)
+    return data.sort_values(["date", "rank"]).reset_index(drop=True)
+
+
+def score_pivot(scores):
+    """Date x symbol matrix of scores (NaN where a stock did not qualify)."""
+    return scores.pivot(index="date", columns="symbol", values="score").sort_index()
+
+
+def top_frequency(scores, top_n=10, dates=None):
+    """How often each symbol ranked in the day's top ``top_n``.
+
+    ``dates`` is the full list of trading days considered (defaults to the
+    days present in ``scores``) and sets the denominator of ``share``.
+    """
+    days = len(dates) if dates is not None else scores["date"].nunique()
+    top = scores[scores["rank"] <= top_n]
+    board = top.groupby("symbol").agg(
+        days_in_top=("date", "count"),
+        avg_score=("score", "mean"),
+        best_rank=("rank", "min"),
+        last_seen=("date", "max"),
+    )
+    board["share"] = board["days_in_top"] / days * 100 if days else 0.0
+    return board.sort_values(["days_in_top", "avg_score"], ascending=False).reset_index()
+
+
+def persistence(scores, top_n=10, dates=None):
+    """Longest and current runs of consecutive trading days in the top ``top_n``.
+
+    Pass every trading day in ``dates`` so days on which nothing qualified
+    still break a run.
+    """
+    top = scores[scores["rank"] <= top_n]
+    if top.empty:
+        return pd.DataFrame(columns=["symbol", "longest_streak", "current_streak"])
+
+    in_top = pd.crosstab(top["date"], top["symbol"]).astype(bool)
+    index = sorted(set(dates) if dates is not None else set(scores["date"]))
+    in_top = in_top.reindex(index, fill_value=False)
+
+    # Run length at each day: running count minus the count at the last miss
+    count = in_top.cumsum()
+    runs = count - count.where(~in_top).ffill().fillna(0)
+    streaks = pd.DataFrame({
+        "longest_streak": runs.max().astype(int),
+        "current_streak": runs.iloc[-1].astype(int),
+    })
+    return streaks.sort_values(["longest_streak", "current_streak"], ascending=False)\
+        .rename_axis("symbol")\
+        .reset_index()
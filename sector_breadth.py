@@ -0,0 +1,151 @@
+"""Sector advance/decline counts computed from scraped quotes.
+
+Each symbol is mapped to one of the pos.py sectors in the symbol_sectors
+table. A day's quotes are joined to that mapping and counted with one
+groupby, which fills sector_data (the Sector Analysis page) and sector_calc
+(the Sector Calculator page) without typing the counts in by hand.
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+
+from constants import SECTORS, get_label
+from storage import WRITE_CHUNK_SIZE
+from sync_cache import sync_table
+
+# pos.py sector -> sector_calc column used by main.py
+SECTOR_CALC_KEYS = {
+    "Hydropower": "hydro",
+    "C. Bank": "cbank",
+    "D. Bank": "dbank",
+    "Finance": "finance",
+    "Hotels": "hotel",
+    "Microfinance": "mf",
+    "Investments": "inv",
+    "Life insurance": "life",
+    "Non-life insurance": "non_life",
+    "Others": "others",
+    "Manufacture": "manu",
+    "Tradings": "trading",
+}
+
+COUNT_COLUMNS = ["positive_stock", "negative_stock", "no_change", "total_stock"]
+
+
+def load_symbol_sectors(store):
+    """Return the symbol -> sector mapping as a (symbol, sector) frame."""
+    response = store.table("symbol_sectors").select("symbol,sector").execute()
+    return pd.DataFrame(response.data or [], columns=["symbol", "sector"])
+
+
+def merge_sector_upload(mapping, upload):
+    """Apply an uploaded (symbol, sector) frame on top of ``mapping``.
+
+    Only symbols in the upload with a sector change; every other symbol
+    keeps its current sector, so a partial upload does not unmap the rest.
+    """
+    upload = upload[["symbol", "sector"]].copy()
+    upload["symbol"] = upload["symbol"].astype(str).str.strip().str.upper()
+    upload = upload.drop_duplicates("symbol", keep="last").set_index("symbol")["sector"]
+    current = mapping.drop_duplicates("symbol", keep="last").set_index("symbol")["sector"]
+    merged = upload.combine_first(current).rename_axis("symbol").reset_index()
+    return merged.sort_values("symbol").reset_index(drop=True)
+
+
+def save_symbol_sectors(store, mapping):
+    """Store a (symbol, sector) frame; rows without a sector are unmapped.
+
+    Returns the number of symbols mapped. Unknown sector names raise
+    ValueError so a bad upload does not half-apply.
+    """
+    mapping = mapping[["symbol", "sector"]].copy()
+    mapping["symbol"] = mapping["symbol"].astype(str).str.strip().str.upper()
+    mapping["sector"] = mapping["sector"].replace("", np.nan)
+    mapping = mapping[mapping["symbol"] != ""].drop_duplicates("symbol", keep="last")
+
+    unknown = sorted(set(mapping["sector"].dropna()) - set(SECTORS))
+    if unknown:
+        raise ValueError(f"Unknown sector(s): {', '.join(unknown)}")
+
+    mapped = mapping.dropna(subset=["sector"])
+    if not mapped.empty:
+        store.table("symbol_sectors")\
+            .upsert(mapped.to_dict("records"), on_conflict="symbol")\
+            .execute()
+    unmapped = mapping.loc[mapping["sector"].isna(), "symbol"].tolist()
+    if unmapped:
+        store.table("symbol_sectors").delete().in_("symbol", unmapped).execute()
+    return len(mapped)
+
+
+def sector_counts(quotes, mapping):
+    """Positive, negative, unchanged and total counts per (date, sector).
+
+    ``quotes`` is long form with date, symbol and pct_change. Symbols
+    without a sector are left out; every mapped sector gets a row for each
+    date. A sector with no valid quote that day has zero counts, a NaN
+    percentage and the label "unknown", not a 0% "weak" reading.
+    """
+    data = quotes[["date", "symbol", "pct_change"]].merge(mapping, on="symbol", how="inner")
+    data = data[data["sector"].isin(SECTORS)]
+    if data.empty:
+        return pd.DataFrame(columns=["date", "sector"] + COUNT_COLUMNS + ["positive_percentage", "label"])
+
+    sign = np.sign(pd.to_numeric(data["pct_change"], errors="coerce"))
+    data = data.assign(
+        positive_stock=(sign > 0).astype(int),
+        negative_stock=(sign < 0).astype(int),
+        no_change=(sign == 0).astype(int),
+        total_stock=sign.notna().astype(int),
+    )
+    counts = data.groupby(["date", "sector"])[COUNT_COLUMNS].sum()
+    full_index = pd.MultiIndex.from_product(
+        [counts.index.levels[0], sorted(set(mapping["sector"]) & set(SECTORS))], names=["date", "sector"]
+    )
+    counts = counts.reindex(full_index, fill_value=0).reset_index()
+
+    total = counts["total_stock"].where(counts["total_stock"] > 0)
+    counts["positive_percentage"] = counts["positive_stock"] / total * 100
+    counts["label"] = counts["positive_percentage"].map(get_label)
+    return counts
+
+
+def sector_calc_rows(counts):
+    """One sector_calc row per date holding each sector's positive count."""
+    wide = counts.pivot(index="date", columns="sector", values="positive_stock")\
+        .rename(columns=SECTOR_CALC_KEYS)
+    return [
+        {"date": date, **{col: float(value) for col, value in row.items()}}
+        for date, row in wide.iterrows()
+    ]
+
+
+def write_sector_counts(store, counts):
+    """Bulk upsert counts into sector_data and sector_calc; returns the dates written.
+
+    Sectors with no valid quote on a day are left out of sector_data, so a
+    data gap never reaches the SMAs as a reading.
+    """
+    if counts.empty:
+        return []
+
+    data_rows = counts[counts["total_stock"] > 0]\
+        .astype({col: float for col in COUNT_COLUMNS})\
+        .to_dict("records")
+    for start in range(0, len(data_rows), WRITE_CHUNK_SIZE):
+        response = store.table("sector_data")\
+            .upsert(data_rows[start:start + WRITE_CHUNK_SIZE], on_conflict="sector,date")\
+            .execute()
+        sync_table("sector_data").apply_rows(response.data)
+
+    calc_rows = sector_calc_rows(counts)
+    for start in range(0, len(calc_rows), WRITE_CHUNK_SIZE):
+        response = store.table("sector_calc")\
+            .upsert(calc_rows[start:start + WRITE_CHUNK_SIZE], on_conflict="date")\
+            .execute()
+        sync_table("sector_calc").apply_rows(response.data)
+
+    dates = sorted(counts["date"].unique())
+    logging.info(f"Sector counts written for {len(dates)} day(s)")
+    return dates
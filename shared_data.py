@@ -0,0 +1,119 @@
+"""Read-only datasets shared by every browser session in the process.
+
+Pages used to copy whole tables into ``st.session_state``, so memory grew
+with each connected session and every session paid for its own load. A
+dataset here is built once per version (usually the table's write version,
+see cache_versions.py) and the same object is handed to every session.
+Callers must treat it as read-only: copy before changing it, and keep only
+their own unsaved edits in session state.
+"""
+import threading
+import time
+
+import pandas as pd
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from singleflight import single_flight
+
+_datasets = {}
+_lock = threading.Lock()
+
+# A session that has not read a dataset for this long no longer counts
+# towards it, even where Streamlit cannot say whether it is still connected
+SESSION_TTL = 30 * 60
+
+
+class SharedDataset:
+    """One built dataset and when each session last read it."""
+
+    def __init__(self, name, version, value):
+        self.name = name
+        self.version = version
+        self.value = value
+        self.built_at = time.monotonic()
+        self.sessions = {}
+
+
+def shared_dataset(name, version, build, max_age=None):
+    """Return dataset ``name``, calling ``build()`` only when it is stale.
+
+    The dataset is rebuilt when ``version`` changes or, if ``max_age`` is
+    given, once it is older than that many seconds (so changes made outside
+    the app still show up).
+    """
+    with _lock:
+        entry = _datasets.get(name)
+    stale = entry is None or entry.version != version or (
+        max_age is not None and time.monotonic() - entry.built_at >= max_age
+    )
+    if stale:
+        # Sessions asking for the same version at once share one build
+        entry = single_flight(("dataset", name, version), lambda: _build(name, version, build))
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None:
+        with _lock:
+            entry.sessions[ctx.session_id] = time.monotonic()
+    return entry.value
+
+
+def _build(name, version, build):
+    entry = SharedDataset(name, version, build())
+    with _lock:
+        _datasets[name] = entry
+    return entry
+
+
+def drop_dataset(name):
+    """Forget dataset ``name`` so the next read rebuilds it."""
+    with _lock:
+        _datasets.pop(name, None)
+
+
+def _prune_sessions(entry, now):
+    """Drop sessions that have disconnected or not read ``entry`` lately."""
+    runtime = Runtime.instance() if Runtime.exists() else None
+    for session_id, seen in list(entry.sessions.items()):
+        gone = runtime is not None and not runtime.is_active_session(session_id)
+        if gone or now - seen >= SESSION_TTL:
+            del entry.sessions[session_id]
+
+
+def dataset_bytes(value):
+    """Deep memory size of a DataFrame, or of a dict/list of them."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sum(dataset_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(dataset_bytes(item) for item in value)
+    return 0
+
+
+def memory_report():
+    """One row per shared dataset: its size and the memory sharing saves.
+
+    "Sessions" counts only sessions still connected that read the dataset
+    within ``SESSION_TTL``. "Per-session MB" is what those sessions would
+    hold if each kept its own copy; "Saved MB" is that minus the one shared
+    copy.
+    """
+    now = time.monotonic()
+    with _lock:
+        entries = list(_datasets.values())
+        for entry in entries:
+            _prune_sessions(entry, now)
+        counts = [len(entry.sessions) for entry in entries]
+    rows = []
+    for entry, sessions in zip(entries, counts):
+        size = dataset_bytes(entry.value) / 2 ** 20
+        rows.append({
+            "Dataset": entry.name,
+            "Version": str(entry.version),
+            "Sessions": sessions,
+            "Shared MB": round(size, 3),
+            "Per-session MB": round(size * sessions, 3),
+            "Saved MB": round(size * max(sessions - 1, 0), 3),
+        })
+    return pd.DataFrame(rows, columns=["Dataset", "Version", "Sessions", "Shared MB", "Per-session MB", "Saved MB"])
@@ -0,0 +1,67 @@
+"""Coalesce concurrent calls for the same key into one execution.
+
+When many sessions open at once they all ask for the same tables. The
+first caller for a key (e.g. ``("sector_data", version)``) runs the fetch;
+callers arriving while it is in flight wait and receive its result, or its
+exception. Once the call finishes the key is released, so later callers
+fetch again and nothing stale is served from here.
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """A group of keyed in-flight calls."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """Run ``fn()`` for ``key`` unless a call for it is already running."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+_group = SingleFlight()
+
+
+def single_flight(key, fn):
+    """Run ``fn()`` once for all concurrent callers with the same ``key``."""
+    return _group.do(key, fn)
+
+
+def flight_stats():
+    """(calls executed, calls that shared another caller's result)."""
+    return _group.executed, _group.shared
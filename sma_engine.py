@@ -0,0 +1,80 @@
+"""Compute sector SMAs from the stored daily sector series.
+
+All sectors are laid out in one contiguous array sorted by (sector, date),
+and every window is a difference of running sums over that array, so the
+whole history costs O(n) per window. A window only yields a value once it
+holds that many non-missing days of its own sector.
+"""
+import numpy as np
+import pandas as pd
+
+from constants import DATE_COL, SECTOR_COL, SECTORS, SMA_COLUMNS, SMA_TABLE
+from storage import WRITE_CHUNK_SIZE
+from sync_cache import sync_table
+
+# "10_SMA" -> 10
+SMA_WINDOWS = {col: int(col.split("_")[0]) for col in SMA_COLUMNS}
+
+# sector_data column the SMAs are taken over
+DEFAULT_SOURCE = "positive_percentage"
+
+
+def compute_smas(series, value_col=DEFAULT_SOURCE):
+    """SMAs for a long-form (sector, date, value) frame, one row per input row."""
+    data = series[[SECTOR_COL, DATE_COL, value_col]].copy()
+    data[DATE_COL] = pd.to_datetime(data[DATE_COL], errors="coerce")
+    data = data[data[SECTOR_COL].isin(SECTORS)].dropna(subset=[DATE_COL])
+    data = data.drop_duplicates([SECTOR_COL, DATE_COL], keep="last")\
+        .sort_values([SECTOR_COL, DATE_COL])\
+        .reset_index(drop=True)
+
+    values = pd.to_numeric(data[value_col], errors="coerce").to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+
+    # Running sums with a leading zero: sum of (i - w, i] = sums[i + 1] - sums[i + 1 - w]
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    # Position of each row within its sector, so windows never cross sectors
+    sector_codes = pd.factorize(data[SECTOR_COL])[0]
+    starts = np.flatnonzero(np.r_[True, sector_codes[1:] != sector_codes[:-1]])
+    position = np.arange(len(data)) - np.repeat(starts, np.diff(np.r_[starts, len(data)]))
+
+    end = np.arange(1, len(data) + 1)
+    for col, window in SMA_WINDOWS.items():
+        begin = np.maximum(end - window, 0)
+        full = (position + 1 >= window) & (counts[end] - counts[begin] == window)
+        data[col] = np.where(full, (sums[end] - sums[begin]) / window, np.nan)
+
+    return data[[SECTOR_COL, DATE_COL] + SMA_COLUMNS]
+
+
+def sma_records(smas):
+    """Rows for sma_data, with dates as strings and missing SMAs as nulls."""
+    records = smas.copy()
+    records[DATE_COL] = records[DATE_COL].dt.strftime("%Y-%m-%d")
+    records = records.astype(object).where(records.notna(), None)
+    return records.to_dict("records")
+
+
+def recompute_smas(store, value_col=DEFAULT_SOURCE, max_age=0):
+    """Recompute every sector's SMAs from sector_data and bulk upsert them.
+
+    Also re-seeds the per-sector rolling state used by indicators.py.
+    Returns the number of sma_data rows written.
+    """
+    series = sync_table("sector_data").load(store, max_age=max_age)
+    if series.empty:
+        return 0
+
+    records = sma_records(compute_smas(series, value_col))
+    for start in range(0, len(records), WRITE_CHUNK_SIZE):
+        response = store.table(SMA_TABLE)\
+            .upsert(records[start:start + WRITE_CHUNK_SIZE], on_conflict="sector,date")\
+            .execute()
+        sync_table(SMA_TABLE).apply_rows(response.data)
+
+    # Keep the incremental state in step with the recomputed history
+    from indicators import rebuild_sector_states  # Import here to avoid circular dependency
+    rebuild_sector_states(store, value_col)
+    return len(records)
@@ -0,0 +1,192 @@
+import threading
+import time
+
+import pandas as pd
+
+from cache_versions import table_version
+from singleflight import single_flight
+
+# Per-table sync settings: natural key, the high-water mark column and,
+# optionally, the columns to fetch. The mark is updated_at, so rows another
+# process inserts for older dates or updates in place are picked up too. In
+# Supabase each synced table needs the column and a trigger keeping it
+# current (the embedded store sets it on every write):
+#
+#   ALTER TABLE sma_data ADD COLUMN updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+#   CREATE EXTENSION IF NOT EXISTS moddatetime;
+#   CREATE TRIGGER sma_data_updated_at BEFORE UPDATE ON sma_data
+#       FOR EACH ROW EXECUTE PROCEDURE moddatetime(updated_at);
+SYNC_TABLES = {
+    "sector_weights": {"key": ["date"], "watermark": "updated_at"},
+    "sector_calc": {"key": ["date"], "watermark": "updated_at"},
+    "sector_data": {
+        "key": ["sector", "date"],
+        "watermark": "updated_at",
+        "columns": [
+            "sector", "date", "positive_stock", "negative_stock", "no_change",
+            "total_stock", "positive_percentage", "label", "created_at", "updated_at",
+        ],
+    },
+    "nepse_equity": {"key": ["date"], "watermark": "updated_at"},
+    "sma_data": {"key": ["sector", "date"], "watermark": "updated_at"},
+    "sector_constituents": {"key": ["sector", "date"], "watermark": "updated_at"},
+}
+
+# Seconds a synced copy is served without asking the database again. Writes
+# made by the app are applied to the copy directly, so this only bounds how
+# long changes made elsewhere take to appear.
+SYNC_MAX_AGE = 30
+
+# Rows per request (Supabase caps responses at 1000)
+SYNC_PAGE_SIZE = 1000
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+class TableSyncCache:
+    """Local copy of one table, refreshed with watermark-based deltas.
+
+    The first load reads the whole table. Later loads fetch only rows at or
+    above the high-water mark, and compare the server row count with the
+    local copy: a key-only query then drops rows deleted elsewhere, and any
+    key the copy lacks triggers a full resync. Write paths in the app pass
+    the rows returned by their upserts and deletes to ``apply_rows`` and
+    ``apply_deletes`` so their own changes show up without waiting.
+    """
+
+    def __init__(self, table_name, key_columns, watermark_column="updated_at", columns=None):
+        self.table_name = table_name
+        self.key_columns = list(key_columns)
+        self.watermark_column = watermark_column
+        self.columns = ",".join(columns) if columns else "*"
+        self.frame = None
+        self.watermark = None
+        self.synced_at = None
+        self._lock = threading.Lock()
+
+    def load(self, store, max_age=0):
+        """Return the table as a DataFrame, syncing only what changed.
+
+        A copy synced less than ``max_age`` seconds ago is returned as is.
+        Concurrent loads of the same table version and ``max_age`` share one
+        sync; a forced load (``max_age`` 0) always syncs itself, so it never
+        receives a result fetched before it was asked for.
+        """
+        if max_age <= 0:
+            return self._sync(store, max_age).copy()
+        key = ("sync", self.table_name, table_version(self.table_name), max_age)
+        return single_flight(key, lambda: self._sync(store, max_age)).copy()
+
+    def _sync(self, store, max_age):
+        # Returns the frame itself; it is only ever replaced, never changed
+        # in place, so callers can copy it outside the lock
+        with self._lock:
+            if self.frame is None:
+                self._full_sync(store)
+            elif self.synced_at is None or time.monotonic() - self.synced_at >= max_age:
+                self._delta_sync(store)
+            return self.frame
+
+    def reset(self):
+        """Drop the local copy so the next load reads the full table."""
+        with self._lock:
+            self.frame = None
+            self.watermark = None
+            self.synced_at = None
+
+    def apply_rows(self, rows):
+        """Merge rows written by the app (e.g. an upsert response) into the copy."""
+        if not rows:
+            return
+        with self._lock:
+            if self.frame is not None:
+                self._merge(pd.DataFrame(rows))
+
+    def apply_deletes(self, rows):
+        """Remove rows deleted by the app (e.g. a delete response) from the copy."""
+        if not rows:
+            return
+        with self._lock:
+            if self.frame is not None and not self.frame.empty:
+                deleted = self._key_index(pd.DataFrame(rows))
+                self.frame = self.frame[~self._key_index(self.frame).isin(deleted)].reset_index(drop=True)
+
+    def _full_sync(self, store):
+        self.frame = pd.DataFrame(self._select_all(store, self.columns))
+        self._advance_watermark()
+        self.synced_at = time.monotonic()
+
+    def _delta_sync(self, store):
+        if self.watermark is None:
+            self._full_sync(store)
+            return
+
+        # gte rather than gt: rows committed with the same timestamp as the
+        # current mark are re-read and de-duplicated by key
+        rows = self._select_all(
+            store, self.columns, lambda query: query.gte(self.watermark_column, self.watermark)
+        )
+        if rows:
+            self._merge(pd.DataFrame(rows))
+
+        # A row count mismatch means rows were deleted elsewhere, or written
+        # without moving the mark (e.g. a table still lacking its trigger)
+        count = store.table(self.table_name)\
+            .select(self.key_columns[0], count="exact", head=True)\
+            .execute()\
+            .count
+        if count is not None and count != len(self.frame):
+            keys = self._select_all(store, ",".join(self.key_columns))
+            live = self._key_index(pd.DataFrame(keys, columns=self.key_columns))
+            if self.frame.empty or not live.isin(self._key_index(self.frame)).all():
+                self._full_sync(store)
+                return
+            self.frame = self.frame[self._key_index(self.frame).isin(live)].reset_index(drop=True)
+        self.synced_at = time.monotonic()
+
+    def _select_all(self, store, columns, where=None):
+        # Page through the result in key order so no response hits the row cap
+        rows = []
+        offset = 0
+        while True:
+            query = store.table(self.table_name).select(columns)
+            if where is not None:
+                query = where(query)
+            for column in self.key_columns:
+                query = query.order(column)
+            page = query.range(offset, offset + SYNC_PAGE_SIZE - 1).execute()
+            rows.extend(page.data or [])
+            if len(page.data or []) < SYNC_PAGE_SIZE:
+                break
+            offset += SYNC_PAGE_SIZE
+        return rows
+
+    def _merge(self, rows):
+        if self.frame is None or self.frame.empty:
+            merged = rows
+        else:
+            merged = pd.concat([self.frame, rows], ignore_index=True)
+        self.frame = merged.drop_duplicates(subset=self.key_columns, keep="last").reset_index(drop=True)
+        self._advance_watermark()
+
+    def _advance_watermark(self):
+        if self.watermark_column in self.frame.columns:
+            marks = self.frame[self.watermark_column].dropna().astype(str)
+            if not marks.empty:
+                self.watermark = marks.max()
+
+    def _key_index(self, df):
+        # Dates may come back as strings or timestamps; compare on strings
+        return pd.MultiIndex.from_frame(df[self.key_columns].astype(str))
+
+
+def sync_table(table_name):
+    """Return the process-wide sync cache for ``table_name``."""
+    with _caches_lock:
+        if table_name not in _caches:
+            config = SYNC_TABLES[table_name]
+            _caches[table_name] = TableSyncCache(
+                table_name, config["key"], config["watermark"], config.get("columns")
+            )
+        return _caches[table_name]
@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import sync_cache  # noqa: E402
+from storage import SQLiteStore  # noqa: E402
+
+# Rows Supabase/PostgREST returns per response at most
+ROW_CAP = 1000
+
+
+class CappedStore:
+    """An embedded store whose selects return at most ``cap`` rows, like Supabase.
+
+    ``delay`` holds each select open for that many seconds after it runs, so
+    concurrent callers can pile up behind it; ``selects`` counts them.
+    """
+
+    def __init__(self, store, cap=ROW_CAP, delay=0):
+        self.store = store
+        self.cap = cap
+        self.delay = delay
+        self.requests = 0
+        self.selects = 0
+        self._lock = threading.Lock()
+
+    def table(self, table_name):
+        self.requests += 1
+        return CappedQuery(self, self.store.table(table_name))
+
+
+class CappedQuery:
+    def __init__(self, owner, query):
+        self.owner = owner
+        self.query = query
+
+    def __getattr__(self, name):
+        method = getattr(self.query, name)
+
+        def call(*args, **kwargs):
+            result = method(*args, **kwargs)
+            return self if result is self.query else result
+        return call
+
+    def execute(self):
+        response = self.query.execute()
+        if self.query._action == "select":
+            response.data = response.data[:self.owner.cap]
+            with self.owner._lock:
+                self.owner.selects += 1
+            time.sleep(self.owner.delay)
+        return response
+
+
+@pytest.fixture
+def store():
+    return SQLiteStore(":memory:")
+
+
+@pytest.fixture
+def capped_store(store):
+    return CappedStore(store)
+
+
+@pytest.fixture
+def slow_store(store):
+    # Selects slow enough for concurrent loads to overlap
+    return CappedStore(store, delay=0.3)
+
+
+@pytest.fixture(autouse=True)
+def fresh_sync_caches():
+    # Sync caches are process-wide; start every test from a cold copy
+    sync_cache._caches.clear()
+    yield
+    sync_cache._caches.clear()
@@ -0,0 +1,46 @@
+import pandas as pd
+
+import app
+from app import SupabaseManager, normalize_stock_table
+
+
+def test_normalize_coerces_bad_cells_to_nan():
+    df = pd.DataFrame({
+        "Symbol": ["NABIL", "NICA", "ADBL"],
+        "% Change": ["1.5%", "N/A", "-2.25"],
+        "Volume": ["1,200", "-", "300"],
+        "Note": ["x", "y", "1"],
+    })
+
+    typed = normalize_stock_table(df)
+
+    assert typed["% Change"].tolist()[0] == 1.5
+    assert pd.isna(typed["% Change"].iloc[1])
+    assert typed["% Change"].iloc[2] == -2.25
+    assert typed["Volume"].fillna(-1).tolist() == [1200, -1, 300]
+    assert typed["Symbol"].tolist() == ["NABIL", "NICA", "ADBL"]
+    assert typed["Note"].tolist() == ["x", "y", "1"]
+
+
+def test_migration_pages_through_every_raw_day(monkeypatch, store, capped_store):
+    # More days than one response holds (see ROW_CAP in conftest.py)
+    days = pd.bdate_range("2018-01-01", periods=1010).strftime("%Y-%m-%d")
+    store.table("raw_stock_data").insert([
+        {"date": day, "data": [{"Symbol": "NABIL", "LTP": "500", "% Change": "1.5"}]} for day in days
+    ]).execute()
+    monkeypatch.setattr(app, "get_store", lambda: capped_store)
+
+    assert SupabaseManager(raw_format="columnar").migrate_raw_to_columnar() == len(days)
+
+    stored = store.table("stock_quotes").select("date", count="exact", head=True).execute()
+    assert stored.count == len(days)
+
+
+def test_available_dates_are_not_truncated(monkeypatch, store, capped_store):
+    days = pd.bdate_range("2018-01-01", periods=1010).strftime("%Y-%m-%d")
+    store.table("stock_quote_days").insert([{"date": day, "symbols": 1} for day in days]).execute()
+    monkeypatch.setattr(app, "get_store", lambda: capped_store)
+
+    dates = SupabaseManager(raw_format="columnar").get_available_dates("raw")
+
+    assert dates == sorted(days, reverse=True)
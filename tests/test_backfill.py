@@ -0,0 +1,102 @@
+import functools
+import os
+import threading
+from datetime import date
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from app import StockDataManager
+from backfill import Backfiller
+from html_parsers import get_parser
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+
+
+class FakeManager:
+    """Parses pages like StockDataManager but records saves instead of storing them."""
+
+    parse_stock_page = StockDataManager.parse_stock_page
+    parse_stock_snapshot = StockDataManager.parse_stock_snapshot
+
+    def __init__(self):
+        self.parser = get_parser()
+        self.excluded_symbols = []
+        self.saves = []
+        self.recounts = []
+
+    def get_available_dates(self, data_type='raw'):
+        return []
+
+    def save_stock_data(self, df, data_type='raw', selected_date=None, update_breadth=True):
+        self.saves.append((selected_date, len(df), update_breadth))
+        return True
+
+    def update_sector_breadth(self, start=None, end=None, quotes=None):
+        self.recounts.append((start, end))
+        return []
+
+
+@pytest.fixture
+def fixture_server():
+    """Serve fixtures/ over HTTP; yields (base url, requested paths, paths to fail once with 503)."""
+    requested = []
+    flaky = set()
+
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            if self.path in flaky:
+                flaky.discard(self.path)
+                self.send_error(503)
+                return
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(Handler, directory=FIXTURES))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requested, flaky
+    server.shutdown()
+    server.server_close()
+
+
+def test_backfill_from_local_fixtures(fixture_server):
+    base_url, requested, _ = fixture_server
+    manager = FakeManager()
+    backfiller = Backfiller(manager=manager, url_template=base_url + "/{date}.html", rate=1000, burst=10, backoff=0)
+
+    summary = backfiller.run(date(2024, 3, 10), date(2024, 3, 16))
+
+    assert summary["saved"] == [date(2024, 3, 12), date(2024, 3, 13), date(2024, 3, 14)]
+    assert summary["skipped"] == [date(2024, 3, 10), date(2024, 3, 11)]
+    assert summary["failed"] == []
+    assert all(rows == 20 and update_breadth is False for _, rows, update_breadth in manager.saves)
+    # Breadth is recounted once over the saved range
+    assert manager.recounts == [(date(2024, 3, 12), date(2024, 3, 14))]
+    # A 404 is not retried
+    assert requested.count("/2024-03-11.html") == 1
+
+
+def test_backfill_retries_server_errors(fixture_server):
+    base_url, requested, flaky = fixture_server
+    flaky.add("/2024-03-12.html")
+    backfiller = Backfiller(manager=FakeManager(), url_template=base_url + "/{date}.html", rate=1000, burst=10, backoff=0)
+
+    assert len(backfiller.fetch_day(date(2024, 3, 12))) == 20
+    assert requested.count("/2024-03-12.html") == 2
+
+
+def test_backfill_recounts_breadth_once(monkeypatch):
+    manager = FakeManager()
+    backfiller = Backfiller(manager=manager, workers=3, rate=1000, burst=10)
+    monkeypatch.setattr(backfiller, "fetch_day", lambda day: pd.DataFrame({"Symbol": ["NABIL"]}))
+
+    summary = backfiller.run(date(2024, 3, 3), date(2024, 3, 14))
+
+    assert len(summary["saved"]) == 10
+    assert all(update_breadth is False for _, _, update_breadth in manager.saves)
+    assert manager.recounts == [(date(2024, 3, 3), date(2024, 3, 14))]
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from breadth import breadth, daily_breadth
+
+THRESHOLDS = [4.0, 2.5, 0.0, 10.0]
+
+
+def naive_breadth(quotes, thresholds):
+    rows = []
+    for day, group in quotes.dropna(subset=["pct_change"]).groupby("date"):
+        changes = group["pct_change"].to_numpy()
+        for threshold in sorted(thresholds):
+            rows.append((day, threshold, int((changes >= threshold).sum()), int((changes <= -threshold).sum()), len(changes)))
+    return rows
+
+
+def test_daily_breadth_matches_a_naive_count():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        size = rng.integers(1, 60)
+        quotes = pd.DataFrame({
+            "date": rng.choice(["2024-03-12", "2024-03-13", "2024-03-14"], size),
+            # Round to hit the thresholds exactly now and then
+            "pct_change": np.round(rng.normal(0, 4, size), 1),
+        })
+        quotes.loc[rng.random(size) < 0.1, "pct_change"] = np.nan
+
+        result = daily_breadth(quotes, THRESHOLDS)
+
+        got = list(zip(result["date"], result["threshold"], result["up"], result["down"], result["total"]))
+        assert got == naive_breadth(quotes, THRESHOLDS)
+
+
+def test_single_day_breadth():
+    result = breadth([5.0, -4.0, 2.5, 0.0, np.nan], [4.0])
+
+    assert result[["up", "down", "total"]].iloc[0].tolist() == [1, 1, 4]
+    assert result["up_pct"].iloc[0] == 25.0
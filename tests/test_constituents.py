@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from constituents import counts_for_dates, load_registry, rebuild_registry, update_registry
+from sector_breadth import SECTOR_CALC_KEYS
+
+SYMBOLS = [f"S{i:02d}" for i in range(30)]
+
+
+def listings(days=40, seed=11):
+    """Daily listed symbols, with symbols joining and leaving over time."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=days).strftime("%Y-%m-%d")
+    listed = rng.random(len(SYMBOLS)) < 0.7
+    rows = []
+    for date in dates:
+        flips = rng.random(len(SYMBOLS)) < 0.05
+        listed = listed ^ flips
+        rows.extend({"date": date, "symbol": symbol} for symbol, on in zip(SYMBOLS, listed) if on)
+    return pd.DataFrame(rows)
+
+
+def mapping():
+    sectors = ["Finance", "Hotels", "Hydropower"]
+    return pd.DataFrame({"symbol": SYMBOLS, "sector": [sectors[i % 3] for i in range(len(SYMBOLS))]})
+
+
+def naive_counts(quotes):
+    listed = quotes.merge(mapping(), on="symbol")
+    return listed.groupby(["date", "sector"]).size().unstack().rename(columns=SECTOR_CALC_KEYS)
+
+
+def registry(store):
+    return load_registry(store).sort_values(["sector", "date"]).reset_index(drop=True)
+
+
+def test_registry_lookups_match_daily_counts(store):
+    quotes = listings()
+    rebuild_registry(store, quotes, mapping())
+
+    dates = sorted(quotes["date"].unique())
+    counts = counts_for_dates(load_registry(store), dates)
+    expected = naive_counts(quotes).fillna(0)
+
+    for column in expected.columns:
+        assert counts[column].tolist() == expected[column].tolist()
+    # Only change points are stored
+    assert len(load_registry(store)) < len(expected) * len(expected.columns)
+
+
+def test_daily_updates_match_a_rebuild(store):
+    quotes = listings()
+    for date in sorted(quotes["date"].unique()):
+        update_registry(store, quotes[quotes["date"] == date], mapping())
+    incremental = registry(store)
+
+    rebuild_registry(store, quotes, mapping())
+
+    pd.testing.assert_frame_equal(incremental, registry(store))
+
+
+def test_older_day_rebuilds_from_all_quotes(store):
+    quotes = listings()
+    dates = sorted(quotes["date"].unique())
+    rebuild_registry(store, quotes[quotes["date"] != dates[10]], mapping())
+
+    update_registry(store, quotes[quotes["date"] == dates[10]], mapping(), all_quotes=lambda: quotes)
+    updated = registry(store)
+
+    rebuild_registry(store, quotes, mapping())
+    pd.testing.assert_frame_equal(updated, registry(store))
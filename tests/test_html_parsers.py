@@ -0,0 +1,43 @@
+import glob
+import os
+
+import pytest
+
+from html_parsers import PARSERS
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+PAGES = sorted(glob.glob(os.path.join(FIXTURES, "*.html")))
+
+
+def parse(parser_name, page):
+    try:
+        return PARSERS[parser_name]().parse(page)
+    except ValueError as e:
+        return type(e).__name__
+
+
+@pytest.mark.parametrize("path", PAGES, ids=os.path.basename)
+def test_backends_agree_on_fixtures(path):
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+
+    assert parse("fast", page) == parse("bs4", page)
+
+
+@pytest.mark.parametrize("name", ["unquoted_attributes.html", "single_quoted_attributes.html"])
+def test_fast_parser_reads_unquoted_and_single_quoted_attributes(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        date_text, headers, rows = PARSERS["fast"]().parse(f.read())
+
+    assert date_text == "2024-03-12 15:00:00"
+    assert headers[:2] == ["S.No", "Symbol"]
+    assert len(rows) == 20
+
+
+def test_table_without_tbody_raises_in_every_backend():
+    with open(os.path.join(FIXTURES, "no_tbody.html"), encoding="utf-8") as f:
+        page = f.read()
+
+    for parser_cls in PARSERS.values():
+        with pytest.raises(ValueError):
+            parser_cls().parse(page)
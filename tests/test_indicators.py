@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from constants import SMA_COLUMNS
+from indicators import RollingWindow, advance_sector_smas
+from sma_engine import compute_smas, recompute_smas
+
+SECTORS = ["Finance", "Hotels", "Hydropower"]
+DAYS = 260
+
+
+def sector_rows(seed=5):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=DAYS).strftime("%Y-%m-%d")
+    rows = pd.DataFrame({
+        "sector": np.tile(SECTORS, DAYS),
+        "date": np.repeat(dates, len(SECTORS)),
+        "positive_percentage": rng.uniform(0, 100, DAYS * len(SECTORS)),
+    })
+    rows.loc[rng.random(len(rows)) < 0.02, "positive_percentage"] = np.nan
+    return rows
+
+
+def write(store, rows):
+    store.table("sector_data").upsert(
+        rows.replace({np.nan: None}).to_dict("records"), on_conflict="sector,date"
+    ).execute()
+
+
+def stored_smas(store):
+    rows = store.table("sma_data").select(",".join(["sector", "date"] + SMA_COLUMNS)).execute().data
+    return pd.DataFrame(rows).sort_values(["sector", "date"]).reset_index(drop=True)
+
+
+def expected_smas(rows):
+    smas = compute_smas(rows)
+    return smas.assign(date=smas["date"].dt.strftime("%Y-%m-%d")).reset_index(drop=True)
+
+
+def assert_same_smas(store, rows):
+    got = stored_smas(store)
+    expected = expected_smas(rows)
+    assert got[["sector", "date"]].equals(expected[["sector", "date"]])
+    np.testing.assert_allclose(
+        got[SMA_COLUMNS].astype(float), expected[SMA_COLUMNS].astype(float), atol=1e-9, equal_nan=True
+    )
+
+
+def test_incremental_days_match_a_full_recompute(store):
+    rows = sector_rows()
+    dates = sorted(rows["date"].unique())
+    seeded = rows[rows["date"] < dates[200]]
+    write(store, seeded)
+    recompute_smas(store)
+
+    for date in dates[200:]:
+        day = rows[rows["date"] == date]
+        write(store, day)
+        advance_sector_smas(store, day)
+
+    assert_same_smas(store, rows)
+
+
+def test_resent_and_older_days_stay_consistent(store):
+    rows = sector_rows()
+    write(store, rows)
+    recompute_smas(store)
+
+    # The latest day re-scraped with new values replaces it in place
+    rows.loc[rows["date"] == rows["date"].max(), "positive_percentage"] += 1
+    latest = rows[rows["date"] == rows["date"].max()]
+    write(store, latest)
+    advance_sector_smas(store, latest)
+    assert_same_smas(store, rows)
+
+    # An older day changes every later SMA, so it falls back to a recompute
+    older = rows["date"] == sorted(rows["date"].unique())[-30]
+    rows.loc[older, "positive_percentage"] = 50.0
+    write(store, rows[older])
+    advance_sector_smas(store, rows[older])
+    assert_same_smas(store, rows)
+
+
+def test_rolling_window_skips_missing_values():
+    window = RollingWindow(3, [1.0, None, 3.0])
+    assert window.mean is None
+
+    window.push(5.0)
+    assert window.mean is None
+    window.push(7.0)
+    assert window.mean == 5.0
@@ -0,0 +1,44 @@
+import pandas as pd
+
+import pos
+
+
+def test_load_all_sector_data_is_not_truncated(monkeypatch, store, capped_store):
+    # 12 sectors x 100 days is over one response's row cap
+    store.table("sector_data").insert([
+        {"sector": sector, "date": f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}", "positive_stock": 1, "total_stock": 2}
+        for sector in pos.SECTORS for day in range(100)
+    ]).execute()
+    monkeypatch.setattr(pos, "get_store", lambda: capped_store)
+
+    loaded = pos.load_all_sector_data()
+
+    assert {sector: len(df) for sector, df in loaded.items()} == {sector: 100 for sector in pos.SECTORS}
+
+
+def test_moving_a_row_to_another_date_keeps_it(monkeypatch, store):
+    store.table("sector_data").insert([
+        {"sector": "Hotels", "date": "2024-01-01", "positive_stock": 5, "negative_stock": 3,
+         "no_change": 2, "total_stock": 10, "positive_percentage": 50.0, "label": "mid"},
+    ]).execute()
+    monkeypatch.setattr(pos, "get_store", lambda: store)
+    df = pos.load_sector_data("Hotels")
+    edited = df.copy()
+    edited["Date"] = pd.Timestamp("2024-01-02")
+
+    assert pos.apply_sector_edits("Hotels", df, edited)
+
+    rows = store.table("sector_data").select("date,positive_stock,label").eq("sector", "Hotels").execute().data
+    assert rows == [{"date": "2024-01-02", "positive_stock": 5.0, "label": "mid"}]
+
+
+def test_resaving_a_date_from_the_form_updates_it(monkeypatch, store):
+    monkeypatch.setattr(pos, "get_store", lambda: store)
+    entry = {"date": pd.Timestamp("2024-03-12"), "positive_stock": 5, "negative_stock": 3,
+             "no_change": 2, "total_stock": 10, "positive_percentage": 50.0}
+
+    assert pos.save_sector_data("Hotels", entry)
+    assert pos.save_sector_data("Hotels", {**entry, "positive_stock": 6, "positive_percentage": 60.0})
+
+    rows = store.table("sector_data").select("positive_stock,label").eq("sector", "Hotels").execute().data
+    assert rows == [{"positive_stock": 6.0, "label": "strong"}]
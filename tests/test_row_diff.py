@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from row_diff import diff_rows
+
+
+def frame(values):
+    return pd.DataFrame({"date": ["2024-03-12", "2024-03-13"], "b": values})
+
+
+def test_filling_one_null_cell_updates_one_row():
+    diff = diff_rows(frame([None, None]), frame([None, 3.0]), ["date"])
+
+    assert diff.updates["date"].tolist() == ["2024-03-13"]
+
+
+def test_none_and_nan_are_the_same_value():
+    diff = diff_rows(frame([None, None]), frame([np.nan, np.nan]), ["date"])
+
+    assert diff.updates.empty and diff.inserts.empty and diff.deletes.empty
+
+
+def test_reload_with_new_dtypes_is_not_an_edit():
+    previous = frame(["1.5", None])
+    edited = frame([1.5, np.nan])
+
+    assert diff_rows(previous, edited, ["date"]).updates.empty
+
+
+def test_text_columns_still_compare_as_text():
+    diff = diff_rows(frame(["strong", None]), frame(["weak", None]), ["date"])
+
+    assert diff.updates["date"].tolist() == ["2024-03-12"]
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from sector_breadth import merge_sector_upload, sector_counts, write_sector_counts
+
+
+def test_partial_upload_keeps_other_mappings():
+    mapping = pd.DataFrame({"symbol": ["NABIL", "NICA", "UPPER"], "sector": ["C. Bank", "C. Bank", None]})
+    upload = pd.DataFrame({"symbol": [" upper", "API"], "sector": ["Hydropower", "Hydropower"]})
+
+    merged = merge_sector_upload(mapping, upload).set_index("symbol")["sector"]
+
+    assert merged.to_dict() == {
+        "API": "Hydropower", "NABIL": "C. Bank", "NICA": "C. Bank", "UPPER": "Hydropower",
+    }
+
+
+def test_sector_without_quotes_is_unknown_and_not_written(store):
+    quotes = pd.DataFrame({
+        "date": ["2024-03-12"] * 3,
+        "symbol": ["NABIL", "NICA", "UPPER"],
+        "pct_change": [1.5, -0.5, None],
+    })
+    mapping = pd.DataFrame({"symbol": ["NABIL", "NICA", "UPPER"], "sector": ["C. Bank", "C. Bank", "Hydropower"]})
+
+    counts = sector_counts(quotes, mapping).set_index("sector")
+
+    assert counts.loc["C. Bank", "positive_percentage"] == 50.0
+    assert pd.isna(counts.loc["Hydropower", "positive_percentage"])
+    assert counts.loc["Hydropower", "label"] == "unknown"
+
+    write_sector_counts(store, counts.reset_index())
+    written = store.table("sector_data").select("sector").execute().data
+    assert [row["sector"] for row in written] == ["C. Bank"]
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import shared_data
+
+
+@pytest.fixture
+def read_as(monkeypatch):
+    """Read a shared dataset as if from the browser session ``session_id``."""
+    def read(session_id):
+        monkeypatch.setattr(shared_data, "get_script_run_ctx",
+                            lambda suppress_warning=False: SimpleNamespace(session_id=session_id))
+        return shared_data.shared_dataset("test.frame", 1, lambda: pd.DataFrame({"x": range(1000)}))
+    yield read
+    shared_data.drop_dataset("test.frame")
+
+
+def sessions_counted():
+    report = shared_data.memory_report()
+    return int(report.loc[report["Dataset"] == "test.frame", "Sessions"].iloc[0])
+
+
+def test_report_drops_sessions_idle_past_ttl(read_as):
+    read_as("a")
+    read_as("b")
+    assert sessions_counted() == 2
+
+    shared_data._datasets["test.frame"].sessions["a"] -= shared_data.SESSION_TTL + 1
+
+    assert sessions_counted() == 1
+
+
+def test_sessions_share_one_frame(read_as):
+    assert read_as("a") is read_as("b")
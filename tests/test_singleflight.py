@@ -0,0 +1,70 @@
+import threading
+import time
+
+from singleflight import SingleFlight
+from sync_cache import sync_table
+
+THREADS = 8
+
+
+def run_threads(target):
+    start = threading.Barrier(THREADS)
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(target())
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return "rows"
+
+    results = run_threads(lambda: group.do("key", fetch))
+
+    assert results == ["rows"] * THREADS
+    assert len(calls) == 1
+    assert (group.executed, group.shared) == (1, THREADS - 1)
+
+
+def test_concurrent_cold_loads_fetch_once(store, slow_store):
+    store.table("sector_data").insert([{"sector": "Finance", "date": "2024-03-12"}]).execute()
+
+    frames = run_threads(lambda: sync_table("sector_data").load(slow_store, max_age=300))
+
+    assert [len(frame) for frame in frames] == [1] * THREADS
+    # A cold full sync is one page plus no follow-up, whatever the thread count
+    assert slow_store.selects == 1
+
+
+def test_forced_load_does_not_join_cached_flight(store, slow_store):
+    store.table("sector_data").insert([{"sector": "Finance", "date": "2024-03-12"}]).execute()
+    cache = sync_table("sector_data")
+    cache.load(store)
+
+    # A cached read starts a slow delta sync; the row is then changed from
+    # outside the app (no version bump) before a forced read is made
+    cache.synced_at = None
+    cached = threading.Thread(target=lambda: cache.load(slow_store, max_age=300))
+    cached.start()
+    time.sleep(0.1)
+    with store.connection:
+        store.connection.execute(
+            "UPDATE sector_data SET positive_stock = 9, updated_at = '9999-12-31' WHERE sector = 'Finance'"
+        )
+    forced = cache.load(slow_store, max_age=0)
+    cached.join()
+
+    assert forced["positive_stock"].tolist() == [9]
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from constants import SMA_COLUMNS
+from sma_engine import SMA_WINDOWS, compute_smas, recompute_smas
+
+SECTORS = ["Finance", "Hotels", "Hydropower"]
+
+
+def random_series(days=260, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=days)
+    series = pd.DataFrame({
+        "sector": np.repeat(SECTORS, days),
+        "date": np.tile(dates, len(SECTORS)),
+        "positive_percentage": rng.uniform(0, 100, days * len(SECTORS)),
+    })
+    series.loc[rng.random(len(series)) < 0.02, "positive_percentage"] = np.nan
+    # Shuffled, as rows come back from the store in no particular order
+    return series.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def naive_smas(series):
+    data = series.sort_values(["sector", "date"]).reset_index(drop=True)
+    for col, window in SMA_WINDOWS.items():
+        data[col] = data.groupby("sector")["positive_percentage"]\
+            .transform(lambda values: values.rolling(window, min_periods=window).mean())
+    return data[["sector", "date"] + SMA_COLUMNS]
+
+
+def test_compute_smas_matches_rolling_means():
+    series = random_series()
+
+    pd.testing.assert_frame_equal(compute_smas(series), naive_smas(series), check_exact=False, atol=1e-9)
+
+
+def test_windows_do_not_cross_sectors():
+    series = pd.DataFrame({
+        "sector": ["Finance"] * 10 + ["Hotels"] * 5,
+        "date": list(pd.bdate_range("2024-01-01", periods=10)) + list(pd.bdate_range("2024-01-01", periods=5)),
+        "positive_percentage": [1.0] * 10 + [100.0] * 5,
+    })
+
+    smas = compute_smas(series)
+
+    assert smas.loc[smas["sector"] == "Finance", "10_SMA"].iloc[-1] == 1.0
+    assert smas.loc[smas["sector"] == "Hotels", "10_SMA"].isna().all()
+
+
+def test_recompute_writes_every_row(store):
+    series = random_series(days=30)
+    store.table("sector_data").insert(
+        series.assign(date=series["date"].dt.strftime("%Y-%m-%d")).replace({np.nan: None}).to_dict("records")
+    ).execute()
+
+    assert recompute_smas(store) == len(series)
+
+    rows = store.table("sma_data").select("sector,date,10_SMA").eq("sector", "Finance").order("date").execute().data
+    expected = naive_smas(series)
+    expected = expected[expected["sector"] == "Finance"]["10_SMA"]
+    np.testing.assert_allclose(
+        [np.nan if row["10_SMA"] is None else row["10_SMA"] for row in rows], expected, equal_nan=True
+    )
@@ -0,0 +1,22 @@
+import sqlite3
+
+import pytest
+
+ROW = {"sector": "Hotels", "date": "2024-03-12", "positive_stock": 5.0}
+
+
+def test_upsert_without_target_conflicts_on_primary_key(store):
+    store.table("sector_data").insert(ROW).execute()
+
+    # PostgREST targets the primary key here, so the natural key collides
+    with pytest.raises(sqlite3.IntegrityError):
+        store.table("sector_data").upsert({**ROW, "positive_stock": 6.0}).execute()
+
+
+def test_upsert_on_natural_key_updates_in_place(store):
+    store.table("sector_data").insert(ROW).execute()
+
+    store.table("sector_data").upsert({**ROW, "positive_stock": 6.0}, on_conflict="sector,date").execute()
+
+    rows = store.table("sector_data").select("positive_stock").execute().data
+    assert rows == [{"positive_stock": 6.0}]
@@ -0,0 +1,70 @@
+from sync_cache import sync_table
+
+SECTORS = ["Hydropower", "Finance", "Hotels"]
+
+
+def seed_sector_data(store, days):
+    store.table("sector_data").insert([
+        {"sector": sector, "date": f"2020-01-01+{day:05d}", "positive_stock": day}
+        for sector in SECTORS for day in range(days)
+    ]).execute()
+
+
+def test_full_load_pages_past_row_cap(store, capped_store):
+    seed_sector_data(store, 2000)
+
+    frame = sync_table("sector_data").load(capped_store)
+
+    assert len(frame) == 6000
+
+
+def test_delta_loads_settle_past_row_cap(store, capped_store):
+    seed_sector_data(store, 2000)
+    cache = sync_table("sector_data")
+
+    sizes = [len(cache.load(capped_store)) for _ in range(4)]
+
+    assert sizes == [6000] * 4
+
+
+def test_delete_check_pages_key_list(store, capped_store):
+    seed_sector_data(store, 2000)
+    cache = sync_table("sector_data")
+    cache.load(capped_store)
+
+    store.table("sector_data").delete().eq("sector", "Hotels").in_("date", ["2020-01-01+00005"]).execute()
+
+    assert len(cache.load(capped_store)) == 5999
+
+
+def test_rows_written_elsewhere_for_older_dates_show_up(store):
+    store.table("sma_data").insert([{"sector": "Finance", "date": "2024-03-14", "10_SMA": 50.0}]).execute()
+    cache = sync_table("sma_data")
+    cache.load(store)
+
+    # Another replica backfills an older date and revises an existing row
+    store.table("sma_data").upsert([
+        {"sector": "Finance", "date": "2024-03-12", "10_SMA": 40.0},
+        {"sector": "Finance", "date": "2024-03-14", "10_SMA": 55.0},
+    ], on_conflict="sector,date").execute()
+
+    frame = cache.load(store).set_index("date")["10_SMA"]
+    assert frame.to_dict() == {"2024-03-12": 40.0, "2024-03-14": 55.0}
+
+
+def test_keys_missing_below_the_mark_resync_once(store, capped_store):
+    seed_sector_data(store, 10)
+    cache = sync_table("sector_data")
+    cache.load(capped_store)
+
+    # A write that did not move updated_at, e.g. before the trigger existed
+    with store.connection:
+        store.connection.execute(
+            "INSERT INTO sector_data (sector, date, updated_at) VALUES ('Others', '2019-01-01', '2000-01-01')"
+        )
+
+    assert len(cache.load(capped_store)) == 31
+    requests = capped_store.requests
+    assert len(cache.load(capped_store)) == 31
+    # Counts agree again, so the next load is the delta page plus the count
+    assert capped_store.requests - requests == 2